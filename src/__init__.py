@@ -1,10 +1,6 @@
 """Audio transcription package using OpenAI Whisper."""
 
 from .config import TranscriptionConfig
-from .transcriber import WhisperTranscriber
-from .file_processor import AudioFileProcessor
-from .formatters import OutputFormatter
-from .app import TranscriptionApp
 
 __version__ = "0.1.0"
 __all__ = [
@@ -13,4 +9,20 @@ __all__ = [
     "AudioFileProcessor",
     "OutputFormatter",
     "TranscriptionApp"
-]
\ No newline at end of file
+]
+
+# Heavy modules (torch, whisper, rich) load on first attribute access
+_LAZY_IMPORTS = {
+    "WhisperTranscriber": ".transcriber",
+    "AudioFileProcessor": ".file_processor",
+    "OutputFormatter": ".formatters",
+    "TranscriptionApp": ".app",
+}
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,15 +1,20 @@
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from rich.console import Console
 from rich.progress import Progress, TaskID, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.table import Table
-from rich.panel import Panel
+from rich.logging import RichHandler
 from loguru import logger
 
 from .config import TranscriptionConfig
 from .transcriber import WhisperTranscriber
 from .file_processor import AudioFileProcessor
-from .formatters import OutputFormatter
+from .formatters import save_result_streaming, show_model_info
 
 class TranscriptionApp:
     """Main application for audio transcription."""
@@ -20,6 +25,11 @@ class TranscriptionApp:
         self.transcriber = None
         self.file_processor = AudioFileProcessor(config)
         
+        # Formatting and disk writes run on a background thread so the
+        # model can start on the next file while the previous one is saved
+        self._write_queue: "queue.Queue[Optional[Tuple[Dict[str, Any], Path, str]]]" = queue.Queue(maxsize=4)
+        self._writer: Optional[threading.Thread] = None
+        
         # Configure logging
         self._setup_logging()
     
@@ -28,46 +38,54 @@ class TranscriptionApp:
         logger.remove()  # Remove default handler
         
         if self.config.verbose:
+            # RichHandler renders time and level itself
             logger.add(
-                lambda msg: self.console.print(f"[dim]{msg}[/dim]", markup=False),
+                RichHandler(console=self.console, markup=False, show_path=False),
                 level="DEBUG",
-                format="{time:HH:mm:ss} | {level} | {message}"
+                format="{message}"
             )
         else:
+            # Only errors the app handles itself, such as a file that failed;
+            # errors that stop the run propagate and are reported by the caller
             logger.add(
-                lambda msg: self.console.print(f"[red]ERROR:[/red] {msg}", markup=False) if "ERROR" in str(msg) else None,
+                sys.stderr,
                 level="ERROR",
-                format="{message}"
+                format="<red>ERROR:</red> {message}"
             )
     
     def run(self) -> None:
-        """Run the transcription process."""
-        try:
-            # Validate configuration
-            self.config.validate_paths()
-            
-            # Initialize transcriber
-            self.transcriber = WhisperTranscriber(self.config)
-            
-            # Discover audio files
-            audio_files = self.file_processor.discover_audio_files()
-            
-            if not audio_files:
+        """Run the transcription process.
+        
+        Errors that stop the run propagate to the caller, which reports them;
+        per-file failures are logged and the remaining files still run.
+        """
+        # Validate configuration
+        self.config.validate_paths()
+        
+        # Discover audio files before loading the model, which may not be needed
+        audio_files = self.file_processor.discover_audio_files()
+        
+        skipped = self.file_processor.skipped_existing
+        if skipped:
+            self.console.print(
+                f"[yellow]{skipped} files already transcribed (use --no-skip-existing)[/yellow]"
+            )
+        
+        if not audio_files:
+            if not skipped:
                 self.console.print("[yellow]No audio files found to transcribe.[/yellow]")
-                return
-            
-            # Show processing info
-            self._show_processing_info(audio_files)
-            
-            # Process files
-            self._process_files(audio_files)
-            
-            self.console.print("\n[green]✓ Transcription completed successfully![/green]")
-            
-        except Exception as e:
-            logger.error(f"Application error: {e}")
-            self.console.print(f"[red]Error: {e}[/red]")
-            raise
+            return
+        
+        # Initialize transcriber
+        self.transcriber = WhisperTranscriber(self.config)
+        
+        # Show processing info
+        self._show_processing_info(audio_files)
+        
+        # Process files, stamping every output with the same run timestamp
+        self._process_files(audio_files, datetime.now().isoformat())
+        
+        self.console.print("\n[green]✓ Transcription completed successfully![/green]")
     
     def _show_processing_info(self, files: List[Path]) -> None:
         """Display information about files to be processed."""
@@ -84,6 +102,7 @@ class TranscriptionApp:
         
         table.add_row("Model", model_info.get('model_name', 'Unknown'))
         table.add_row("Device", model_info.get('device', 'Unknown'))
+        table.add_row("Compute Type", self.config.compute_type)
         table.add_row("Language", self.config.language or "Auto-detect")
         table.add_row("Output Format", self.config.output_format.upper())
         table.add_row("Files to Process", str(stats['total_files']))
@@ -94,7 +113,7 @@ class TranscriptionApp:
         self.console.print(table)
         self.console.print()
     
-    def _process_files(self, files: List[Path]) -> None:
+    def _process_files(self, files: List[Path], generated_at: str) -> None:
         """Process all audio files with progress tracking."""
         with Progress(
             SpinnerColumn(),
@@ -107,86 +126,139 @@ class TranscriptionApp:
             
             main_task = progress.add_task("Processing files...", total=len(files))
             
-            for batch in self.file_processor.batch_files(files):
+            self._start_writer()
+            try:
+                self._process_batches(files, progress, main_task, generated_at)
+            finally:
+                self._stop_writer()
+    
+    def _process_batches(
+        self,
+        files: List[Path],
+        progress: Progress,
+        main_task: TaskID,
+        generated_at: str
+    ) -> None:
+        """Transcribe files batch by batch, queueing results for the writer.
+        
+        Audio decoding and mel spectrograms for the next batch are prepared on
+        a worker thread while the model transcribes the current one. A single
+        prefetch worker keeps one batch decoding at a time, so the thread pool
+        preload_mels sizes to the CPU count is never multiplied.
+        """
+        batches = self.file_processor.batch_files(files)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batch = next(batches, None)
+            pending = executor.submit(self.transcriber.preload_mels, batch) if batch else None
+            
+            while batch is not None:
+                next_batch = next(batches, None)
+                current = pending
+                pending = executor.submit(self.transcriber.preload_mels, next_batch) if next_batch else None
+                
                 batch_task = progress.add_task(
                     f"Batch ({len(batch)} files)", 
                     total=len(batch)
                 )
                 
-                for audio_file in batch:
+                try:
+                    preloaded = current.result()
+                except Exception as e:
+                    logger.warning("Failed to preload batch, transcribing files individually: {}", e)
+                    preloaded = None
+                
+                results = self._transcribe_batch(batch, preloaded)
+                
+                for i, (audio_file, result) in enumerate(zip(batch, results)):
                     progress.update(
                         batch_task, 
                         description=f"Transcribing {audio_file.name}"
                     )
                     
                     try:
-                        self._process_single_file(audio_file)
+                        if result is None:
+                            audio = preloaded[i][0] if preloaded else None
+                            result = self.transcriber.transcribe_file(audio_file, audio)
+                        self._process_single_file(audio_file, result, generated_at)
                         progress.advance(batch_task)
                         progress.advance(main_task)
                         
                     except Exception as e:
-                        logger.error(f"Failed to process {audio_file}: {e}")
+                        logger.error("Failed to process {}: {}", audio_file, e)
                         progress.advance(batch_task)
                         progress.advance(main_task)
                         continue
                 
                 progress.remove_task(batch_task)
+                batch = next_batch
     
-    def _process_single_file(self, audio_file: Path) -> None:
-        """Process a single audio file."""
-        # Transcribe
-        result = self.transcriber.transcribe_file(audio_file)
+    def _transcribe_batch(
+        self,
+        batch: List[Path],
+        preloaded: Optional[List[Tuple[Any, Any]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Transcribe a batch in one pass; None marks files to transcribe individually."""
+        if len(batch) == 1 or preloaded is None:
+            return [None] * len(batch)
         
-        # Get output path
+        try:
+            # Files that fail on their own come back as None; only a failed
+            # stacked decode raises, leaving no result to keep
+            return self.transcriber.transcribe_files(batch, preloaded)
+        except Exception as e:
+            logger.warning("Batch transcription failed, retrying files individually: {}", e)
+            return [None] * len(batch)
+    
+    def _process_single_file(self, audio_file: Path, result: Dict[str, Any], generated_at: str) -> None:
+        """Queue the transcription result of a single audio file for saving."""
         output_path = self.file_processor.get_output_path(
             audio_file, 
             self.config.output_format
         )
         
-        # Validate output path
-        self.file_processor.validate_output_path(output_path)
-        
-        # Format and save
-        formatted_content = OutputFormatter.format_result(
-            result, 
-            self.config.output_format
-        )
-        
-        OutputFormatter.save_result(formatted_content, output_path)
+        self._write_queue.put((result, output_path, generated_at))
+    
+    def _start_writer(self) -> None:
+        """Start the background thread that formats and saves results."""
+        self._writer = threading.Thread(target=self._write_results, name="transcription-writer", daemon=True)
+        self._writer.start()
+    
+    def _stop_writer(self) -> None:
+        """Wait for queued results to be written and stop the writer thread."""
+        if self._writer is None:
+            return
         
-        if self.config.verbose:
-            self.console.print(f"[green]✓[/green] Saved transcription: {output_path}")
+        self._write_queue.put(None)
+        self._writer.join()
+        self._writer = None
+    
+    def _write_results(self) -> None:
+        """Writer thread loop: save queued results until the sentinel arrives."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                return
+            
+            result, output_path, generated_at = item
+            try:
+                # Validate output path
+                self.file_processor.validate_output_path(output_path)
+                
+                # Format and save
+                save_result_streaming(
+                    result,
+                    output_path,
+                    self.config.output_format,
+                    generated_at
+                )
+                
+                if self.config.verbose:
+                    self.console.print(f"[green]✓[/green] Saved transcription: {output_path}")
+                    
+            except Exception as e:
+                logger.error("Failed to save {}: {}", output_path, e)
     
     def show_model_info(self) -> None:
         """Display information about available models."""
-        available_models = [
-            "tiny", "tiny.en", "base", "base.en", 
-            "small", "small.en", "medium", "medium.en", 
-            "large-v1", "large-v2", "large-v3", "large"
-        ]
-        
-        table = Table(title="Available Whisper Models")
-        table.add_column("Model", style="cyan")
-        table.add_column("Languages", style="white")
-        table.add_column("Size", style="yellow")
-        table.add_column("Speed", style="green")
-        
-        model_info = [
-            ("tiny", "Multilingual", "~39 MB", "Very Fast"),
-            ("tiny.en", "English only", "~39 MB", "Very Fast"),
-            ("base", "Multilingual", "~74 MB", "Fast"),
-            ("base.en", "English only", "~74 MB", "Fast"),
-            ("small", "Multilingual", "~244 MB", "Medium"),
-            ("small.en", "English only", "~244 MB", "Medium"),
-            ("medium", "Multilingual", "~769 MB", "Slow"),
-            ("medium.en", "English only", "~769 MB", "Slow"),
-            ("large-v1", "Multilingual", "~1550 MB", "Very Slow"),
-            ("large-v2", "Multilingual", "~1550 MB", "Very Slow"),
-            ("large-v3", "Multilingual", "~1550 MB", "Very Slow"),
-            ("large", "Multilingual", "~1550 MB", "Very Slow"),
-        ]
-        
-        for model, langs, size, speed in model_info:
-            table.add_row(model, langs, size, speed)
-        
-        self.console.print(table)
\ No newline at end of file
+        show_model_info(self.console)
\ No newline at end of file
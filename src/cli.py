@@ -3,8 +3,7 @@ from typing import Optional
 import click
 from rich.console import Console
 
-from .config import TranscriptionConfig, OutputFormat, Device
-from .app import TranscriptionApp
+from .config import TranscriptionConfig, OutputFormat, Backend, Device, ComputeType, BucketBy, default_discover_workers
 
 console = Console()
 
@@ -15,8 +14,15 @@ console = Console()
 @click.option('--language', default='en', help='Language for transcription (auto-detect if not specified)')
 @click.option('--output-format', default='md', type=click.Choice(['md', 'txt', 'json', 'srt', 'vtt']),
               help='Output format')
+@click.option('--backend', default='openai', type=click.Choice(['openai', 'faster']),
+              help='Inference backend (faster needs the faster-whisper package)')
 @click.option('--device', default='cpu', type=click.Choice(['cpu', 'cuda', 'mps']),
               help='Device to use for processing')
+@click.option('--compute-type', default='default',
+              type=click.Choice(['default', 'float32', 'float16', 'bfloat16', 'int8', 'int8_float16']),
+              help='Model precision (bfloat16 and int8_float16 need the faster backend)')
+@click.option('--compile/--no-compile', 'compile_model', default=False,
+              help='torch.compile the model (slow first load, faster inference)')
 @click.option('--temperature', default=0.0, type=float,
               help='Sampling temperature (0.0 to 1.0)')
 @click.option('--top-p', default=1.0, type=float,
@@ -27,6 +33,8 @@ console = Console()
               help='Batch size for processing')
 @click.option('--max-length', type=int,
               help='Maximum transcription length')
+@click.option('--bucket-by', default='size', type=click.Choice(['size', 'duration']),
+              help='Batch files of similar size or duration together')
 @click.option('--audio-file', type=click.Path(exists=True, path_type=Path),
               help='Single audio file to transcribe')
 @click.option('--audio-folder', type=click.Path(exists=True, file_okay=False, path_type=Path),
@@ -37,6 +45,10 @@ console = Console()
               help='Output file for single transcription')
 @click.option('--recursive/--no-recursive', default=False,
               help='Recursively search audio folder')
+@click.option('--skip-existing/--no-skip-existing', default=True,
+              help='Skip audio files whose transcription already exists')
+@click.option('--discover-workers', default=default_discover_workers, type=int,
+              help='Threads used to stat files during folder discovery')
 @click.option('--verbose/--quiet', default=False,
               help='Enable verbose output')
 @click.option('--models-info', is_flag=True,
@@ -45,17 +57,23 @@ def main(
     model: str,
     language: Optional[str],
     output_format: OutputFormat,
+    backend: Backend,
     device: Device,
+    compute_type: ComputeType,
+    compile_model: bool,
     temperature: float,
     top_p: float,
     top_k: Optional[int],
     batch_size: int,
     max_length: Optional[int],
+    bucket_by: Optional[BucketBy],
     audio_file: Optional[Path],
     audio_folder: Optional[Path],
     transcribe_folder: Optional[Path],
     transcription_file: Optional[Path],
     recursive: bool,
+    skip_existing: bool,
+    discover_workers: int,
     verbose: bool,
     models_info: bool
 ):
@@ -77,27 +95,36 @@ def main(
     """
     
     if models_info:
-        app = TranscriptionApp(TranscriptionConfig())
-        app.show_model_info()
+        from .formatters import show_model_info
+        show_model_info(console)
         return
     
+    # Deferred so --help and --models-info never import torch/whisper
+    from .app import TranscriptionApp
+    
     try:
         # Create configuration
         config = TranscriptionConfig(
             model=model,
             language=language,
             output_format=output_format,
+            backend=backend,
             device=device,
+            compute_type=compute_type,
+            compile_model=compile_model,
             temperature=temperature,
             top_p=top_p,
             top_k=top_k,
             batch_size=batch_size,
             max_length=max_length,
+            bucket_by=bucket_by,
             audio_file=audio_file,
             audio_folder=audio_folder,
             transcribe_folder=transcribe_folder,
             transcription_file=transcription_file,
             recursive=recursive,
+            skip_existing=skip_existing,
+            discover_workers=discover_workers,
             verbose=verbose
         )
         
@@ -106,7 +133,7 @@ def main(
         app.run()
         
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        # ClickException prints "Error: ..." to stderr, the one report of the failure
         raise click.ClickException(str(e))
 
 if __name__ == '__main__':
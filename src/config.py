@@ -1,35 +1,108 @@
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Literal
-from pydantic import BaseModel, Field, ConfigDict
+from typing import ClassVar, Optional, Literal, get_args
 
 OutputFormat = Literal["md", "txt", "json", "srt", "vtt"]
 Device = Literal["cpu", "cuda", "mps"]
+BucketBy = Literal["size", "duration"]
+Backend = Literal["openai", "faster"]
+ComputeType = Literal["default", "float32", "float16", "bfloat16", "int8", "int8_float16"]
 
-class TranscriptionConfig(BaseModel):
-    model_config = ConfigDict(validate_assignment=True)
+# Compute types only CTranslate2 (the faster-whisper runtime) can run
+FASTER_ONLY_COMPUTE_TYPES: frozenset[str] = frozenset({"bfloat16", "int8_float16"})
+
+SUPPORTED_AUDIO_EXTS: frozenset[str] = frozenset({
+    '.mp3', '.wav', '.m4a', '.flac', '.ogg', '.opus', '.wma', '.aac', '.mp4', '.mkv', '.avi'
+})
+
+def default_discover_workers() -> int:
+    """Default thread count for file discovery; stat calls are I/O bound."""
+    return min(32, (os.cpu_count() or 1) * 4)
+
+@dataclass(frozen=True, slots=True)
+class TranscriptionConfig:
+    """Immutable transcription settings, validated once on construction."""
     
     # Whisper model parameters
-    model: str = Field(default="base", description="Whisper model to use")
-    language: Optional[str] = Field(default="en", description="Language for transcription")
-    temperature: float = Field(default=0.0, ge=0.0, le=1.0, description="Sampling temperature")
-    top_p: float = Field(default=1.0, ge=0.0, le=1.0, description="Top-p sampling parameter")
-    top_k: Optional[int] = Field(default=None, ge=1, description="Top-k sampling parameter")
+    model: str = "base"
+    language: Optional[str] = "en"
+    temperature: float = 0.0
+    top_p: float = 1.0
+    top_k: Optional[int] = None
     
     # Processing parameters
-    device: Optional[Device] = Field(default=None, description="Device for processing (auto-detect if None)")
-    batch_size: int = Field(default=1, ge=1, description="Batch size for processing")
-    max_length: Optional[int] = Field(default=None, ge=1, description="Maximum transcription length")
+    backend: Backend = "openai"
+    device: Optional[Device] = None
+    compute_type: ComputeType = "default"
+    compile_model: bool = False
+    batch_size: int = 1
+    max_length: Optional[int] = None
+    bucket_by: Optional[BucketBy] = "size"
     
     # File handling parameters
-    audio_file: Optional[Path] = Field(default=None, description="Single audio file to transcribe")
-    audio_folder: Optional[Path] = Field(default=None, description="Folder to search for audio files")
-    transcribe_folder: Optional[Path] = Field(default=None, description="Output folder for transcriptions")
-    transcription_file: Optional[Path] = Field(default=None, description="Output file for single transcription")
-    recursive: bool = Field(default=False, description="Recursively search audio folder")
+    audio_file: Optional[Path] = None
+    audio_folder: Optional[Path] = None
+    transcribe_folder: Optional[Path] = None
+    transcription_file: Optional[Path] = None
+    recursive: bool = False
+    skip_existing: bool = True
+    discover_workers: int = field(default_factory=default_discover_workers)
     
     # Output parameters
-    output_format: OutputFormat = Field(default="md", description="Output format")
-    verbose: bool = Field(default=False, description="Enable verbose output")
+    output_format: OutputFormat = "md"
+    verbose: bool = False
+    
+    supported_extensions: ClassVar[frozenset[str]] = SUPPORTED_AUDIO_EXTS
+    
+    def __post_init__(self) -> None:
+        """Validate value ranges and choices, and coerce path fields to Path."""
+        if not 0.0 <= self.temperature <= 1.0:
+            raise ValueError(f"temperature must be between 0.0 and 1.0, got {self.temperature}")
+        
+        if not 0.0 <= self.top_p <= 1.0:
+            raise ValueError(f"top_p must be between 0.0 and 1.0, got {self.top_p}")
+        
+        if self.top_k is not None and self.top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {self.top_k}")
+        
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {self.batch_size}")
+        
+        if self.max_length is not None and self.max_length < 1:
+            raise ValueError(f"max_length must be at least 1, got {self.max_length}")
+        
+        if self.discover_workers < 1:
+            raise ValueError(f"discover_workers must be at least 1, got {self.discover_workers}")
+        
+        if self.device is not None and self.device not in get_args(Device):
+            raise ValueError(f"Unsupported device: {self.device}")
+        
+        if self.backend not in get_args(Backend):
+            raise ValueError(f"Unsupported backend: {self.backend}")
+        
+        if self.backend == "faster" and self.device == "mps":
+            raise ValueError("The faster backend does not support the mps device")
+        
+        if self.compute_type not in get_args(ComputeType):
+            raise ValueError(f"Unsupported compute type: {self.compute_type}")
+        
+        if self.backend == "openai" and self.compute_type in FASTER_ONLY_COMPUTE_TYPES:
+            raise ValueError(f"compute_type '{self.compute_type}' requires the faster backend")
+        
+        if self.backend == "faster" and self.compile_model:
+            raise ValueError("compile_model requires the openai backend")
+        
+        if self.bucket_by is not None and self.bucket_by not in get_args(BucketBy):
+            raise ValueError(f"Unsupported bucket_by value: {self.bucket_by}")
+        
+        if self.output_format not in get_args(OutputFormat):
+            raise ValueError(f"Unsupported output format: {self.output_format}")
+        
+        for name in ("audio_file", "audio_folder", "transcribe_folder", "transcription_file"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, Path):
+                object.__setattr__(self, name, Path(value))
     
     def validate_paths(self) -> None:
         """Validate that required paths exist and configurations are consistent."""
@@ -46,9 +119,4 @@ class TranscriptionConfig(BaseModel):
             raise ValueError("Cannot specify both audio_file and audio_folder")
         
         if self.transcribe_folder and not self.transcribe_folder.exists():
-            self.transcribe_folder.mkdir(parents=True, exist_ok=True)
-    
-    @property
-    def supported_extensions(self) -> set[str]:
-        """Get supported audio file extensions."""
-        return {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.mp4', '.mkv', '.avi'}
\ No newline at end of file
+            self.transcribe_folder.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
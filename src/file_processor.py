@@ -1,41 +1,135 @@
+import bisect
+import os
+import shutil
+import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Generator, Optional
+from typing import Dict, List, Generator, Optional, Set
 from loguru import logger
 
-from .config import TranscriptionConfig
+from .config import TranscriptionConfig, SUPPORTED_AUDIO_EXTS
+
+# Upper bounds (seconds) of the duration buckets used by batch_files
+DURATION_BUCKETS = (10.0, 30.0, 120.0)
+
+# File extension for each output format
+_FORMAT_EXTS = {
+    'md': 'md',
+    'txt': 'txt',
+    'json': 'json',
+    'srt': 'srt',
+    'vtt': 'vtt'
+}
 
 class AudioFileProcessor:
     """Handles discovery and processing of audio files."""
     
     def __init__(self, config: TranscriptionConfig):
         self.config = config
+        self._file_sizes: Dict[Path, int] = {}
+        self._durations: Dict[Path, Optional[float]] = {}
+        self._writable_dirs: Set[Path] = set()
+        # Files dropped by the last discovery because their output already exists
+        self.skipped_existing = 0
+        self._ext = SUPPORTED_AUDIO_EXTS
+        # Extensions without the leading dot, for matching raw directory entry names
+        self._ext_set = frozenset(ext[1:] for ext in SUPPORTED_AUDIO_EXTS)
     
     def discover_audio_files(self) -> List[Path]:
         """Discover audio files based on configuration."""
         if self.config.audio_file:
-            return [self.config.audio_file]
+            # A file named explicitly is always transcribed, even if its output exists
+            files = [self.config.audio_file]
+        elif self.config.audio_folder:
+            files = self._find_audio_files(self.config.audio_folder)
+            if self.config.skip_existing:
+                files = self._skip_transcribed(files)
+        else:
+            raise ValueError("No audio source specified")
+        
+        return files
+    
+    def _skip_transcribed(self, files: List[Path]) -> List[Path]:
+        """Drop files whose transcription output already exists."""
+        pending = [f for f in files if not self._is_transcribed(f)]
         
-        if self.config.audio_folder:
-            return self._find_audio_files(self.config.audio_folder)
+        self.skipped_existing = len(files) - len(pending)
+        if self.skipped_existing:
+            logger.info("Skipping {} already transcribed files", self.skipped_existing)
         
-        raise ValueError("No audio source specified")
+        return pending
+    
+    def _is_transcribed(self, audio_path: Path) -> bool:
+        """Whether a non-empty transcription output exists for an audio file."""
+        try:
+            # An empty file is left by a write that never got going, not a transcript
+            return self.get_output_path(audio_path, self.config.output_format).stat().st_size > 0
+        except OSError:
+            return False
     
     def _find_audio_files(self, folder: Path) -> List[Path]:
         """Find audio files in the specified folder."""
-        audio_files = []
+        candidates = []
+        pending = [folder]
         
-        pattern = "**/*" if self.config.recursive else "*"
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # Symlinked directories are not followed to avoid cycles
+                        if self._is_subdirectory(entry):
+                            if self.config.recursive:
+                                pending.append(entry.path)
+                            continue
+                        
+                        stem, _, ext = entry.name.rpartition('.')
+                        if stem and ext.lower() in self._ext_set:
+                            candidates.append(entry)
+            except OSError as e:
+                # An unreadable or vanished directory should not end the whole walk
+                logger.warning("Skipping unreadable directory {}: {}", directory, e)
+        
+        # stat() releases the GIL, so threads overlap filesystem latency
+        workers = min(self.config.discover_workers, len(candidates))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                stats = list(executor.map(self._stat_audio_entry, candidates))
+        else:
+            stats = [self._stat_audio_entry(entry) for entry in candidates]
         
-        for path in folder.glob(pattern):
-            if path.is_file() and self._is_audio_file(path):
+        audio_files = []
+        for entry, size in zip(candidates, stats):
+            if size is not None:
+                path = Path(entry.path)
                 audio_files.append(path)
+                self._file_sizes[path] = size
         
-        logger.info(f"Found {len(audio_files)} audio files in {folder}")
+        logger.info("Found {} audio files in {}", len(audio_files), folder)
         return sorted(audio_files)
     
+    @staticmethod
+    def _is_subdirectory(entry: os.DirEntry) -> bool:
+        """Whether an entry is a real (not symlinked) directory; False if it can't be read."""
+        try:
+            return entry.is_dir(follow_symlinks=False)
+        except OSError:
+            return False
+    
+    @staticmethod
+    def _stat_audio_entry(entry: os.DirEntry) -> Optional[int]:
+        """Return the size of a regular file entry, or None if it is not one."""
+        try:
+            if not entry.is_file():
+                return None
+            return entry.stat().st_size
+        except OSError:
+            return None
+    
     def _is_audio_file(self, path: Path) -> bool:
         """Check if a file is an audio file based on extension."""
-        return path.suffix.lower() in self.config.supported_extensions
+        return path.suffix.lower() in self._ext
     
     def get_output_path(self, audio_path: Path, output_format: str) -> Path:
         """Generate output path for transcription file."""
@@ -57,50 +151,131 @@ class AudioFileProcessor:
     
     def _get_extension_for_format(self, output_format: str) -> str:
         """Get file extension for output format."""
-        format_extensions = {
-            'md': 'md',
-            'txt': 'txt',
-            'json': 'json',
-            'srt': 'srt',
-            'vtt': 'vtt'
-        }
-        return format_extensions.get(output_format, 'txt')
+        return _FORMAT_EXTS.get(output_format, 'txt')
     
     def batch_files(self, files: List[Path]) -> Generator[List[Path], None, None]:
         """Yield batches of files for processing."""
         batch_size = self.config.batch_size
         
-        for i in range(0, len(files), batch_size):
-            yield files[i:i + batch_size]
+        for group in self._group_files(files):
+            for i in range(0, len(group), batch_size):
+                yield group[i:i + batch_size]
+    
+    def _group_files(self, files: List[Path]) -> List[List[Path]]:
+        """Group files so each batch holds items of similar length."""
+        if self.config.batch_size == 1:
+            # One file per batch, so there is no padding to save
+            return [files]
+        
+        if self.config.bucket_by == "duration":
+            durations = self._get_durations(files)
+            if durations is None:
+                logger.warning("Could not probe audio durations, bucketing by size instead")
+                return [sorted(files, key=self._get_file_size, reverse=True)]
+            
+            buckets: List[List[Path]] = [[] for _ in range(len(DURATION_BUCKETS) + 1)]
+            
+            for f in sorted(files, key=durations.__getitem__, reverse=True):
+                buckets[bisect.bisect_left(DURATION_BUCKETS, durations[f])].append(f)
+            
+            return [bucket for bucket in buckets if bucket]
+        
+        if self.config.bucket_by == "size":
+            # Largest first, so consecutive slices hold files of similar length
+            # and no batch waits on one long file among short ones
+            return [sorted(files, key=self._get_file_size, reverse=True)]
+        
+        return [files]
+    
+    def _get_file_size(self, path: Path) -> int:
+        """Get file size in bytes, using sizes cached during discovery."""
+        size = self._file_sizes.get(path)
+        if size is None:
+            size = path.stat().st_size if path.exists() else 0
+            self._file_sizes[path] = size
+        return size
+    
+    def _get_durations(self, files: List[Path]) -> Optional[Dict[Path, float]]:
+        """Get audio durations in seconds, or None if any file can't be probed.
+        
+        Each file is probed only once. ffprobe runs are independent
+        subprocesses, so they share the discovery thread pool size.
+        """
+        missing = [f for f in files if f not in self._durations]
+        if missing:
+            if shutil.which("ffprobe") is None:
+                return None
+            
+            workers = min(self.config.discover_workers, len(missing))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    probed = list(executor.map(self._probe_duration, missing))
+            else:
+                probed = [self._probe_duration(f) for f in missing]
+            self._durations.update(zip(missing, probed))
+        
+        durations = {f: self._durations[f] for f in files}
+        if None in durations.values():
+            return None
+        return durations
+    
+    def _probe_duration(self, path: Path) -> Optional[float]:
+        """Get audio duration in seconds via ffprobe (None if unknown)."""
+        try:
+            output = subprocess.run(
+                [
+                    "ffprobe", "-v", "error",
+                    "-show_entries", "format=duration",
+                    "-of", "default=noprint_wrappers=1:nokey=1",
+                    str(path)
+                ],
+                capture_output=True, text=True, check=True
+            ).stdout
+            return float(output.strip())
+        except (OSError, subprocess.CalledProcessError, ValueError) as e:
+            logger.warning("Could not determine duration of {}: {}", path, e)
+            return None
     
     def validate_output_path(self, output_path: Path) -> None:
         """Validate that output path is writable."""
+        parent = output_path.parent
+        if parent in self._writable_dirs:
+            return
+        
         try:
             # Create parent directories if they don't exist
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Test write permissions
-            test_file = output_path.parent / ".write_test"
-            test_file.touch()
-            test_file.unlink()
-            
+            parent.mkdir(parents=True, exist_ok=True)
         except PermissionError:
-            raise PermissionError(f"No write permission for: {output_path.parent}")
+            raise PermissionError(f"No write permission for: {parent}")
         except Exception as e:
             raise RuntimeError(f"Cannot write to output path {output_path}: {e}")
+        
+        if not os.access(parent, os.W_OK):
+            raise PermissionError(f"No write permission for: {parent}")
+        
+        self._writable_dirs.add(parent)
     
     def get_file_stats(self, files: List[Path]) -> dict:
         """Get statistics about the files to be processed."""
-        total_size = sum(f.stat().st_size for f in files if f.exists())
+        total_size = 0
+        extensions = Counter()
         
-        extensions = {}
         for f in files:
-            ext = f.suffix.lower()
-            extensions[ext] = extensions.get(ext, 0) + 1
+            total_size += self._get_file_size(f)
+            extensions[f.suffix.lower()] += 1
         
         return {
             'total_files': len(files),
             'total_size_mb': round(total_size / (1024 * 1024), 2),
-            'file_types': extensions,
-            'batch_count': len(list(self.batch_files(files)))
-        }
\ No newline at end of file
+            'file_types': dict(extensions),
+            'batch_count': self._count_batches(files)
+        }
+    
+    def _count_batches(self, files: List[Path]) -> int:
+        """Count the batches batch_files would yield, without building them."""
+        batch_size = self.config.batch_size
+        
+        if self.config.bucket_by == "duration":
+            return sum(-(-len(group) // batch_size) for group in self._group_files(files))
+        
+        return -(-len(files) // batch_size)
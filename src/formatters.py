@@ -1,163 +1,348 @@
 import json
+import os
+import secrets
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterator, List, Optional, TextIO, Tuple
 from datetime import datetime
+from rich.console import Console
+from rich.table import Table
 
-class OutputFormatter:
-    """Format transcription results for different output formats."""
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is the fallback
+    orjson = None
+
+# Buffer size for streamed output
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Subtitle timestamps are converted with NumPy from this many on; below it
+# the import and array setup cost more than they save
+_VECTORIZE_MIN_TIMESTAMPS = 128
+
+AVAILABLE_MODELS = [
+    ("tiny", "Multilingual", "~39 MB", "Very Fast"),
+    ("tiny.en", "English only", "~39 MB", "Very Fast"),
+    ("base", "Multilingual", "~74 MB", "Fast"),
+    ("base.en", "English only", "~74 MB", "Fast"),
+    ("small", "Multilingual", "~244 MB", "Medium"),
+    ("small.en", "English only", "~244 MB", "Medium"),
+    ("medium", "Multilingual", "~769 MB", "Slow"),
+    ("medium.en", "English only", "~769 MB", "Slow"),
+    ("large-v1", "Multilingual", "~1550 MB", "Very Slow"),
+    ("large-v2", "Multilingual", "~1550 MB", "Very Slow"),
+    ("large-v3", "Multilingual", "~1550 MB", "Very Slow"),
+    ("large", "Multilingual", "~1550 MB", "Very Slow"),
+]
+
+# Header templates, filled from result metadata by format_map
+_MD_HEADER = (
+    "# Transcription\n\n"
+    "**File:** {file_path}\n"
+    "**Model:** {model}\n"
+    "**Language:** {language}\n"
+    "**Duration:** {duration:.2f} seconds\n"
+    "**Generated:** {generated_at}\n\n"
+    "## Content\n\n"
+)
+
+_TEXT_HEADER = (
+    "Transcription of: {file_path}\n"
+    "Model: {model}\n"
+    "Language: {language}\n"
+    "Duration: {duration:.2f} seconds\n"
+    "Generated: {generated_at}\n\n"
+    + "=" * 50 + "\n\n"
+)
+
+_METADATA_DEFAULTS = {
+    'file_path': 'Unknown',
+    'model': 'Unknown',
+    'language': 'Unknown',
+    'duration': 0
+}
+
+def show_model_info(console: Console) -> None:
+    """Display information about available models."""
+    table = Table(title="Available Whisper Models")
+    table.add_column("Model", style="cyan")
+    table.add_column("Languages", style="white")
+    table.add_column("Size", style="yellow")
+    table.add_column("Speed", style="green")
+    
+    for model, langs, size, speed in AVAILABLE_MODELS:
+        table.add_row(model, langs, size, speed)
+    
+    console.print(table)
+
+def format_markdown(result: Dict[str, Any], generated_at: Optional[str] = None) -> str:
+    """Format transcription result as Markdown."""
+    text = result.get('text', '').strip()
+    header = _MD_HEADER.format_map(_header_fields(result, generated_at))
     
-    @staticmethod
-    def format_markdown(result: Dict[str, Any]) -> str:
-        """Format transcription result as Markdown."""
-        metadata = result.get('metadata', {})
+    # Add segments if available
+    segments = result.get('segments', [])
+    if not segments:
+        return f"{header}{text}\n"
+    
+    # The full text goes into the single join, not a header + text copy first
+    parts = [header, text, "\n\n## Segments\n\n"]
+    for i, segment in enumerate(segments, 1):
+        start = segment.get('start', 0)
+        end = segment.get('end', 0)
+        segment_text = segment.get('text', '').strip()
+        parts.append(f"**{i}.** [{start:.2f}s - {end:.2f}s] {segment_text}\n\n")
+    
+    return "".join(parts)
+
+def format_text(result: Dict[str, Any], generated_at: Optional[str] = None) -> str:
+    """Format transcription result as plain text."""
+    text = result.get('text', '').strip()
+    return _TEXT_HEADER.format_map(_header_fields(result, generated_at)) + text
+
+def _header_fields(result: Dict[str, Any], generated_at: Optional[str]) -> Dict[str, Any]:
+    """Merge result metadata over the defaults used by the header templates."""
+    fields = _METADATA_DEFAULTS | result.get('metadata', {})
+    fields['generated_at'] = _generated_at(generated_at)
+    return fields
+
+def _generated_at(generated_at: Optional[str]) -> str:
+    """The given run-wide timestamp, or the current local time for one-off calls."""
+    return generated_at or datetime.now().isoformat()
+
+def format_json(result: Dict[str, Any], generated_at: Optional[str] = None) -> str:
+    """Format transcription result as JSON."""
+    # Add generation timestamp
+    result['generated_at'] = _generated_at(generated_at)
+    data = _orjson_dumps(result)
+    if data is not None:
+        return data.decode('utf-8')
+    return json.dumps(result, indent=2, ensure_ascii=False, default=_json_default)
+
+def _orjson_dumps(result: Dict[str, Any]) -> Optional[bytes]:
+    """Serialize with orjson, or return None if it is missing or rejects the data."""
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    except TypeError:
+        # e.g. non-string keys, which the stdlib encoder accepts
+        return None
+
+def _json_default(value: Any) -> Any:
+    """Convert NumPy scalars and arrays, which the stdlib encoder rejects."""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def format_srt(result: Dict[str, Any], generated_at: Optional[str] = None) -> str:
+    """Format transcription result as SRT subtitle format."""
+    return "".join(_srt_cues(result))
+
+def format_vtt(result: Dict[str, Any], generated_at: Optional[str] = None) -> str:
+    """Format transcription result as WebVTT format."""
+    return "".join(_vtt_cues(result))
+
+def stream_srt(result: Dict[str, Any], fp: TextIO) -> None:
+    """Write transcription result as SRT to a text file object, one cue at a time."""
+    for cue in _srt_cues(result):
+        fp.write(cue)
+
+def stream_vtt(result: Dict[str, Any], fp: TextIO) -> None:
+    """Write transcription result as WebVTT to a text file object, one cue at a time."""
+    for cue in _vtt_cues(result):
+        fp.write(cue)
+
+def _srt_cues(result: Dict[str, Any]) -> Iterator[str]:
+    """Yield the SRT document one cue at a time."""
+    segments = result.get('segments', [])
+    if not segments:
+        # If no segments, create a single subtitle from the full text
         text = result.get('text', '').strip()
-        
-        content = f"""# Transcription
-
-**File:** {metadata.get('file_path', 'Unknown')}
-**Model:** {metadata.get('model', 'Unknown')}
-**Language:** {metadata.get('language', 'Unknown')}
-**Duration:** {metadata.get('duration', 0):.2f} seconds
-**Generated:** {datetime.now().isoformat()}
-
-## Content
-
-{text}
-"""
-        
-        # Add segments if available
-        segments = result.get('segments', [])
-        if segments:
-            content += "\n## Segments\n\n"
-            for i, segment in enumerate(segments, 1):
-                start = segment.get('start', 0)
-                end = segment.get('end', 0)
-                segment_text = segment.get('text', '').strip()
-                content += f"**{i}.** [{start:.2f}s - {end:.2f}s] {segment_text}\n\n"
-        
-        return content
-    
-    @staticmethod
-    def format_text(result: Dict[str, Any]) -> str:
-        """Format transcription result as plain text."""
+        duration = result.get('metadata', {}).get('duration', 30)
+        yield f"1\n00:00:00,000 --> {_format_srt_time(duration)}\n{text}\n\n"
+        return
+    
+    starts, ends = _format_segment_times(segments, ',')
+    for i, (segment, start_time, end_time) in enumerate(zip(segments, starts, ends), 1):
+        text = segment.get('text', '').strip()
+        yield f"{i}\n{start_time} --> {end_time}\n{text}\n\n"
+
+def _vtt_cues(result: Dict[str, Any]) -> Iterator[str]:
+    """Yield the WebVTT document, header first, one cue at a time."""
+    yield "WEBVTT\n\n"
+    
+    segments = result.get('segments', [])
+    if not segments:
+        # If no segments, create a single subtitle from the full text
         text = result.get('text', '').strip()
-        metadata = result.get('metadata', {})
-        
-        header = f"""Transcription of: {metadata.get('file_path', 'Unknown')}
-Model: {metadata.get('model', 'Unknown')}
-Language: {metadata.get('language', 'Unknown')}
-Duration: {metadata.get('duration', 0):.2f} seconds
-Generated: {datetime.now().isoformat()}
-
-{'='*50}
-
-"""
-        return header + text
-    
-    @staticmethod
-    def format_json(result: Dict[str, Any]) -> str:
-        """Format transcription result as JSON."""
-        # Add generation timestamp
-        result['generated_at'] = datetime.now().isoformat()
-        return json.dumps(result, indent=2, ensure_ascii=False)
-    
-    @staticmethod
-    def format_srt(result: Dict[str, Any]) -> str:
-        """Format transcription result as SRT subtitle format."""
-        segments = result.get('segments', [])
-        if not segments:
-            # If no segments, create a single subtitle from the full text
-            text = result.get('text', '').strip()
-            duration = result.get('metadata', {}).get('duration', 30)
-            return f"""1
-00:00:00,000 --> {OutputFormatter._format_srt_time(duration)}
-{text}
-
-"""
-        
-        srt_content = ""
-        for i, segment in enumerate(segments, 1):
-            start_time = OutputFormatter._format_srt_time(segment.get('start', 0))
-            end_time = OutputFormatter._format_srt_time(segment.get('end', 0))
-            text = segment.get('text', '').strip()
-            
-            srt_content += f"""{i}
-{start_time} --> {end_time}
-{text}
-
-"""
-        
-        return srt_content
-    
-    @staticmethod
-    def format_vtt(result: Dict[str, Any]) -> str:
-        """Format transcription result as WebVTT format."""
-        segments = result.get('segments', [])
-        
-        vtt_content = "WEBVTT\n\n"
-        
-        if not segments:
-            # If no segments, create a single subtitle from the full text
-            text = result.get('text', '').strip()
-            duration = result.get('metadata', {}).get('duration', 30)
-            vtt_content += f"""00:00:00.000 --> {OutputFormatter._format_vtt_time(duration)}
-{text}
-
-"""
-            return vtt_content
-        
-        for segment in segments:
-            start_time = OutputFormatter._format_vtt_time(segment.get('start', 0))
-            end_time = OutputFormatter._format_vtt_time(segment.get('end', 0))
-            text = segment.get('text', '').strip()
-            
-            vtt_content += f"""{start_time} --> {end_time}
-{text}
-
-"""
-        
-        return vtt_content
-    
-    @staticmethod
-    def _format_srt_time(seconds: float) -> str:
-        """Format seconds to SRT time format (HH:MM:SS,mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
-    
-    @staticmethod
-    def _format_vtt_time(seconds: float) -> str:
-        """Format seconds to WebVTT time format (HH:MM:SS.mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
-    
-    @classmethod
-    def format_result(cls, result: Dict[str, Any], output_format: str) -> str:
-        """Format result according to specified format."""
-        formatters = {
-            'md': cls.format_markdown,
-            'txt': cls.format_text,
-            'json': cls.format_json,
-            'srt': cls.format_srt,
-            'vtt': cls.format_vtt
-        }
-        
-        formatter = formatters.get(output_format)
-        if not formatter:
-            raise ValueError(f"Unsupported output format: {output_format}")
-        
-        return formatter(result)
-    
-    @staticmethod
-    def save_result(content: str, output_path: Path) -> None:
-        """Save formatted content to file."""
+        duration = result.get('metadata', {}).get('duration', 30)
+        yield f"00:00:00.000 --> {_format_vtt_time(duration)}\n{text}\n\n"
+        return
+    
+    starts, ends = _format_segment_times(segments, '.')
+    for segment, start_time, end_time in zip(segments, starts, ends):
+        text = segment.get('text', '').strip()
+        yield f"{start_time} --> {end_time}\n{text}\n\n"
+
+def _format_srt_time(seconds: float) -> str:
+    """Format seconds to SRT time format (HH:MM:SS,mmm)."""
+    return _format_timestamp(seconds, ',')
+
+def _format_vtt_time(seconds: float) -> str:
+    """Format seconds to WebVTT time format (HH:MM:SS.mmm)."""
+    return _format_timestamp(seconds, '.')
+
+def _format_timestamp(seconds: float, separator: str) -> str:
+    """Format seconds as HH:MM:SS<separator>mmm using integer milliseconds."""
+    # Rounding once avoids float error, e.g. 61.123 -> 61122.99... ms
+    hours, rem = divmod(round(seconds * 1000), 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, milliseconds = divmod(rem, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{milliseconds:03d}"
+
+def _format_segment_times(segments: List[Dict[str, Any]], separator: str) -> Tuple[List[str], List[str]]:
+    """Format every segment's start and end time."""
+    times = [segment.get('start', 0) for segment in segments]
+    times += [segment.get('end', 0) for segment in segments]
+    formatted = _format_timestamps(times, separator)
+    return formatted[:len(segments)], formatted[len(segments):]
+
+def _format_timestamps(seconds: List[float], separator: str) -> List[str]:
+    """Format many timestamps, doing the arithmetic in NumPy for long lists."""
+    if len(seconds) < _VECTORIZE_MIN_TIMESTAMPS:
+        return [_format_timestamp(value, separator) for value in seconds]
+    
+    import numpy as np
+    
+    # rint rounds half to even like round(), so results match _format_timestamp
+    milliseconds = np.rint(np.asarray(seconds, dtype=np.float64) * 1000).astype(np.int64)
+    
+    hours, rem = np.divmod(milliseconds, 3_600_000)
+    minutes, rem = np.divmod(rem, 60_000)
+    secs, milliseconds = np.divmod(rem, 1000)
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}{separator}{ms:03d}"
+        for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), milliseconds.tolist())
+    ]
+
+def format_result(result: Dict[str, Any], output_format: str, generated_at: Optional[str] = None) -> str:
+    """Format result according to specified format.
+    
+    ``generated_at`` lets a batch run stamp every file with one timestamp;
+    it defaults to the current time. Subtitle formats carry no timestamp.
+    """
+    formatter = FORMATTERS.get(output_format)
+    if not formatter:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    
+    return formatter(result, generated_at)
+
+def save_result(content: str, output_path: Path) -> None:
+    """Save formatted content to file."""
+    _save_bytes(content.encode('utf-8'), output_path)
+
+@contextmanager
+def _replacing(output_path: Path) -> Iterator[Path]:
+    """Yield a temporary path that replaces ``output_path`` once written.
+    
+    An interrupted or failed write leaves any previous file untouched rather
+    than a truncated transcript that skip_existing would take as finished.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f".{output_path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _save_bytes(data: bytes, output_path: Path) -> None:
+    """Write encoded content to a file, creating parent directories."""
+    try:
+        with _replacing(output_path) as tmp_path:
+            # The content is already complete, so it goes straight to the file
+            # descriptor without a BufferedWriter copy or open()'s extra syscalls
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+    except Exception as e:
+        raise RuntimeError(f"Failed to save to {output_path}: {e}")
+
+def save_result_streaming(
+    result: Dict[str, Any],
+    output_path: Path,
+    output_format: str,
+    generated_at: Optional[str] = None
+) -> None:
+    """Format and save a result, writing JSON and subtitles without an intermediate str."""
+    streamer = _STREAMERS.get(output_format)
+    if streamer is not None:
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(content, encoding='utf-8')
+            # newline='' keeps '\n' line endings, matching save_result on every platform
+            with _replacing(output_path) as tmp_path, \
+                    open(tmp_path, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
+                streamer(result, f)
         except Exception as e:
-            raise RuntimeError(f"Failed to save to {output_path}: {e}")
\ No newline at end of file
+            raise RuntimeError(f"Failed to save to {output_path}: {e}")
+        return
+    
+    if output_format != 'json':
+        save_result(format_result(result, output_format, generated_at), output_path)
+        return
+    
+    result['generated_at'] = _generated_at(generated_at)
+    data = _orjson_dumps(result)
+    if data is not None:
+        _save_bytes(data, output_path)
+        return
+    
+    try:
+        # json.dump issues one write() per token; a large buffer batches them
+        with _replacing(output_path) as tmp_path, \
+                open(tmp_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            json.dump(result, f, indent=2, ensure_ascii=False, default=_json_default)
+    except Exception as e:
+        raise RuntimeError(f"Failed to save to {output_path}: {e}")
+
+# Formatter for each output format; format_result dispatches with one lookup
+FORMATTERS: Dict[str, Callable[[Dict[str, Any], Optional[str]], str]] = {
+    'md': format_markdown,
+    'txt': format_text,
+    'json': format_json,
+    'srt': format_srt,
+    'vtt': format_vtt
+}
+
+# Formats whose cues are written straight to the output file
+_STREAMERS = {
+    'srt': stream_srt,
+    'vtt': stream_vtt
+}
+
+class OutputFormatter:
+    """Format transcription results for different output formats.
+    
+    Namespace over the module-level functions, kept for existing imports.
+    """
+    
+    format_markdown = staticmethod(format_markdown)
+    format_text = staticmethod(format_text)
+    format_json = staticmethod(format_json)
+    format_srt = staticmethod(format_srt)
+    format_vtt = staticmethod(format_vtt)
+    stream_srt = staticmethod(stream_srt)
+    stream_vtt = staticmethod(stream_vtt)
+    format_result = staticmethod(format_result)
+    save_result = staticmethod(save_result)
+    save_result_streaming = staticmethod(save_result_streaming)
+    _format_srt_time = staticmethod(_format_srt_time)
+    _format_vtt_time = staticmethod(_format_vtt_time)
\ No newline at end of file
@@ -1,93 +1,564 @@
-import torch
-import whisper
+import contextlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, ContextManager, Dict, Any, List, Optional, Tuple
 from loguru import logger
 
 from .config import TranscriptionConfig
 
+# torch and whisper take seconds to import, so they are imported inside the
+# functions that use them rather than when this module is imported
+if TYPE_CHECKING:
+    import torch
+    import whisper
+
+# Loaded models keyed by (model, device, compute_type, backend, compile_model),
+# shared by every WhisperTranscriber in the process, least recently used first
+_MODEL_CACHE: OrderedDict[Tuple[str, str, str, str, bool], Any] = OrderedDict()
+
+# Models kept loaded at once; each holds tens of MB to several GB of weights
+_MODEL_CACHE_SIZE = 4
+
+# transcribe()'s default quality thresholds, applied to batched decodes so a
+# clip is filtered the same way whichever path transcribes it
+_NO_SPEECH_THRESHOLD = 0.6
+_LOGPROB_THRESHOLD = -1.0
+_COMPRESSION_RATIO_THRESHOLD = 2.4
+
+def _physical_cores() -> int:
+    """Physical CPU core count, or the logical count if psutil is unavailable."""
+    try:
+        import psutil
+    except ImportError:
+        return os.cpu_count() or 1
+    return psutil.cpu_count(logical=False) or os.cpu_count() or 1
+
+@lru_cache(maxsize=8)
+def _resolve_device(requested: str, backend: str) -> str:
+    """Resolve the requested device to one that is available, probing once per process."""
+    import torch
+    
+    if requested == "cuda" and torch.cuda.is_available():
+        return "cuda"
+    elif requested == "mps" and torch.backends.mps.is_available():
+        return "mps"
+    elif requested == "cpu":
+        return "cpu"
+    else:
+        # Auto-detect best device if not explicitly set (CTranslate2 has no MPS)
+        if backend == "openai" and torch.backends.mps.is_available():
+            logger.info("Apple Silicon detected, using MPS acceleration")
+            return "mps"
+        elif torch.cuda.is_available():
+            return "cuda"
+        else:
+            return "cpu"
+
 class WhisperTranscriber:
-    """Core transcription class using OpenAI Whisper."""
+    """Core transcription class using OpenAI Whisper or faster-whisper."""
     
     def __init__(self, config: TranscriptionConfig):
         self.config = config
         self.model = None
+        # Probing CUDA/MPS availability is not free, so it happens once per process
+        self._device = self._get_device()
+        # Side CUDA stream for host-to-device mel copies, created on first use
+        self._copy_stream = None
+        # Parameter count, computed on first get_model_info() call
+        self._param_count: Optional[int] = None
         self._load_model()
+        # The config is immutable, so per-file options are built once
+        self._base_options = self._get_transcription_options()
     
     def _load_model(self) -> None:
-        """Load the Whisper model."""
+        """Load the Whisper model, reusing one already loaded with the same settings."""
         try:
-            device = self._get_device()
-            logger.info(f"Loading Whisper model '{self.config.model}' on {device}")
+            device = self._device
+            key = (
+                self.config.model, device, self.config.compute_type,
+                self.config.backend, self.config.compile_model
+            )
             
-            # Load model with appropriate precision
-            if device == "cpu":
-                # Use FP32 for CPU to avoid warning
-                self.model = whisper.load_model(self.config.model, device=device)
-                # Ensure model uses FP32
-                if hasattr(self.model, 'half'):
-                    self.model = self.model.float()
-            else:
-                # GPU/MPS can use FP16
-                self.model = whisper.load_model(self.config.model, device=device)
+            self.model = _MODEL_CACHE.get(key)
+            if self.model is not None:
+                _MODEL_CACHE.move_to_end(key)
+                logger.info("Reusing loaded Whisper model '{}' on {}", self.config.model, device)
+                return
+            
+            self.model = _MODEL_CACHE[key] = self._create_model(device)
+            while len(_MODEL_CACHE) > _MODEL_CACHE_SIZE:
+                _MODEL_CACHE.popitem(last=False)
                 
         except Exception as e:
-            logger.error(f"Failed to load Whisper model: {e}")
+            logger.debug("Failed to load Whisper model: {}", e)
             raise
     
+    def _create_model(self, device: str) -> Any:
+        """Load a new model for the configured backend and compute type."""
+        import torch
+        import whisper
+        
+        compute_type = self.config.compute_type
+        logger.info("Loading Whisper model '{}' on {} ({}, {} backend)",
+                    self.config.model, device, compute_type, self.config.backend)
+        
+        if self.config.backend == "faster":
+            return self._load_faster_model(device)
+        
+        # Fail before the (slow) download/load if the precision can't run here
+        if compute_type == "float16" and device == "cpu":
+            raise ValueError("compute_type 'float16' requires a cuda or mps device")
+        if compute_type == "int8" and device != "cpu":
+            raise ValueError("compute_type 'int8' is only supported on cpu")
+        
+        if device == "cpu":
+            self._configure_cpu_threads()
+        elif device == "cuda":
+            # Let FP32 matmuls outside autocast use TF32 tensor cores
+            torch.set_float32_matmul_precision("high")
+            # The encoder input shape never changes, so autotuned convs are reused
+            torch.backends.cudnn.benchmark = True
+        
+        # load_model already materializes FP32 weights on the target device;
+        # FP16 decoding on GPU/MPS casts per layer, or under autocast
+        model = whisper.load_model(self.config.model, device=device)
+        
+        if compute_type == "float16":
+            model = model.half()
+        elif compute_type == "int8":
+            model = self._quantize_int8(model)
+        
+        if self.config.compile_model:
+            model = self._compile(model)
+        
+        if self.config.compile_model or device != "cpu":
+            self._warm_up(model)
+        
+        return model
+    
+    def _compile(self, model: "whisper.Whisper") -> "whisper.Whisper":
+        """torch.compile the encoder and decoder forwards."""
+        import torch
+        
+        logger.info("Compiling Whisper model; the first run takes a while")
+        # The encoder always sees one 30-second window, so CUDA graphs can be replayed
+        model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+        model.decoder = torch.compile(model.decoder)
+        return model
+    
+    def _warm_up(self, model: "whisper.Whisper") -> None:
+        """Run one encoder pass so kernel selection/compilation happens at load time."""
+        import torch
+        import whisper
+        
+        dtype = torch.float16 if self._use_fp16() else torch.float32
+        dummy = torch.zeros(1, model.dims.n_mels, whisper.audio.N_FRAMES, device=self._device, dtype=dtype)
+        with torch.inference_mode(), self._autocast():
+            model.encoder(dummy)
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached models so their memory can be reclaimed."""
+        _MODEL_CACHE.clear()
+    
+    def _load_faster_model(self, device: str) -> Any:
+        """Load a CTranslate2 Whisper model through faster-whisper."""
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as e:
+            raise ImportError(
+                "The faster backend requires faster-whisper: "
+                "install it with `uv add faster-whisper` or `pip install faster-whisper`"
+            ) from e
+        
+        if self.config.top_p != 1.0 or self.config.top_k is not None:
+            logger.warning("top_p/top_k are not supported by the faster backend and are ignored")
+        
+        compute_type = self.config.compute_type
+        if compute_type == "default":
+            compute_type = "int8" if device == "cpu" else "float16"
+        
+        options: Dict[str, Any] = {'compute_type': compute_type}
+        if device == "cpu":
+            options['cpu_threads'] = _physical_cores()
+        
+        return WhisperModel(self.config.model, device=device, **options)
+    
+    @staticmethod
+    def _configure_cpu_threads() -> None:
+        """Run intra-op work on one thread per physical core.
+        
+        Hyperthread siblings share vector units, so using every logical CPU
+        oversubscribes them. Inter-op parallelism is disabled: the app already
+        overlaps audio decoding and file writing on its own threads. An
+        explicit OMP_NUM_THREADS is respected.
+        """
+        import torch
+        
+        if "OMP_NUM_THREADS" not in os.environ:
+            torch.set_num_threads(_physical_cores())
+        
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Only settable before the process first runs inter-op parallel work
+            pass
+    
+    @staticmethod
+    def _quantize_int8(model: "whisper.Whisper") -> "whisper.Whisper":
+        """Dynamically quantize the model's Linear layers to int8 for CPU inference."""
+        import torch
+        
+        # Prefer the x86/FBGEMM VNNI kernels; ARM builds only ship QNNPACK
+        engines = torch.backends.quantized.supported_engines
+        torch.backends.quantized.engine = next(
+            engine for engine in ("x86", "fbgemm", "qnnpack", engines[0]) if engine in engines
+        )
+        
+        # whisper.model.Linear only adds a dtype cast to forward(); quantize_dynamic
+        # matches exact types, so swap it back to nn.Linear first
+        for module in model.modules():
+            if isinstance(module, torch.nn.Linear):
+                module.__class__ = torch.nn.Linear
+        
+        # In place, so the fp32 weights are freed rather than deep-copied first
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    
     def _get_device(self) -> str:
         """Determine the best available device."""
-        if self.config.device == "cuda" and torch.cuda.is_available():
-            return "cuda"
-        elif self.config.device == "mps" and torch.backends.mps.is_available():
-            return "mps"
-        elif self.config.device == "cpu":
-            return "cpu"
-        else:
-            # Auto-detect best device if not explicitly set
-            if torch.backends.mps.is_available():
-                logger.info("Apple Silicon detected, using MPS acceleration")
-                return "mps"
-            elif torch.cuda.is_available():
-                return "cuda"
-            else:
-                return "cpu"
+        return _resolve_device(self.config.device, self.config.backend)
     
-    def transcribe_file(self, audio_path: Path) -> Dict[str, Any]:
-        """Transcribe a single audio file."""
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    def transcribe_file(self, audio_path: Path, audio: Optional[Any] = None) -> Dict[str, Any]:
+        """Transcribe a single audio file, optionally from already decoded audio."""
+        import torch
         
-        if not self._is_supported_format(audio_path):
-            raise ValueError(f"Unsupported audio format: {audio_path.suffix}")
+        self._check_audio_path(audio_path)
         
         try:
-            logger.info(f"Transcribing: {audio_path}")
+            logger.info("Transcribing: {}", audio_path)
             
-            # Prepare transcription options
-            options = self._get_transcription_options()
+            if self.config.backend == "faster":
+                result = self._transcribe_faster(str(audio_path) if audio is None else audio)
+            else:
+                # Perform transcription
+                with torch.inference_mode(), self._autocast():
+                    result = self.model.transcribe(
+                        str(audio_path) if audio is None else audio,
+                        **self._base_options
+                    )
             
-            # Perform transcription
-            result = self.model.transcribe(
-                str(audio_path),
-                **options
-            )
+            self._add_metadata(result, audio_path)
+            
+            logger.success("Successfully transcribed: {}", audio_path)
+            return result
             
-            # Add metadata
-            result['metadata'] = {
-                'file_path': str(audio_path),
-                'file_size': audio_path.stat().st_size,
-                'model': self.config.model,
-                'language': result.get('language', self.config.language),
-                'duration': result.get('segments', [{}])[-1].get('end', 0) if result.get('segments') else 0
+        except Exception as e:
+            logger.debug("Failed to transcribe {}: {}", audio_path, e)
+            raise
+    
+    def _transcribe_faster(self, audio: Any) -> Dict[str, Any]:
+        """Transcribe with faster-whisper, returning the openai-whisper result shape."""
+        options: Dict[str, Any] = {'language': self.config.language, 'beam_size': 1}
+        if self.config.temperature != 0.0:
+            options['temperature'] = self.config.temperature
+        
+        # faster-whisper decodes lazily; consuming the generator runs the model
+        segments, info = self.model.transcribe(audio, **options)
+        segments = [
+            {
+                'id': segment.id,
+                'seek': segment.seek,
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+                'tokens': segment.tokens,
+                'temperature': segment.temperature,
+                'avg_logprob': segment.avg_logprob,
+                'compression_ratio': segment.compression_ratio,
+                'no_speech_prob': segment.no_speech_prob
             }
+            for segment in segments
+        ]
+        
+        return {
+            'text': "".join(segment['text'] for segment in segments),
+            'segments': segments,
+            'language': info.language
+        }
+    
+    def preload_mels(self, audio_paths: List[Path]) -> List[Tuple[Any, Optional["torch.Tensor"]]]:
+        """Decode audio and compute log-mel spectrograms for a batch.
+        
+        Returns ``(audio, mel)`` pairs aligned with ``audio_paths``. ``mel`` is
+        padded to one 30-second window, and is None for recordings that need
+        sliding-window decoding (and for single-file batches and the faster
+        backend, which are never stacked). This is CPU work and can run on a
+        worker thread while the model is busy with the previous batch.
+        """
+        for audio_path in audio_paths:
+            self._check_audio_path(audio_path)
+        
+        stack = len(audio_paths) > 1 and self.config.backend == "openai"
+        
+        # ffmpeg decoding and the STFT both release the GIL, so files overlap
+        workers = min(len(audio_paths), os.cpu_count() or 1)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(lambda path: self._preload_one(path, stack), audio_paths))
+        
+        return [self._preload_one(audio_path, stack) for audio_path in audio_paths]
+    
+    def _preload_one(self, audio_path: Path, stack: bool) -> Tuple[Any, Optional["torch.Tensor"]]:
+        """Decode one file, plus its padded mel if it can join a stacked batch."""
+        import whisper
+        
+        audio = whisper.load_audio(str(audio_path))
+        mel = None
+        if stack and audio.shape[0] <= whisper.audio.N_SAMPLES:
+            # Built exactly as transcribe() builds its window: the STFT runs over
+            # audio followed by 30 s of silence, and the content frames are then
+            # padded to N_FRAMES, so a clip gets the same input in either path
+            content_frames = audio.shape[0] // whisper.audio.HOP_LENGTH
+            mel = whisper.log_mel_spectrogram(
+                audio, n_mels=self.model.dims.n_mels, padding=whisper.audio.N_SAMPLES
+            )
+            mel = whisper.pad_or_trim(mel[:, :content_frames], whisper.audio.N_FRAMES)
+            if self._device == "cuda":
+                # Pinned host memory lets the later device copy run asynchronously
+                mel = mel.pin_memory()
+        return audio, mel
+    
+    def transcribe_files(
+        self,
+        audio_paths: List[Path],
+        preloaded: Optional[List[Tuple[Any, Optional["torch.Tensor"]]]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Transcribe several audio files, returning results in input order.
+        
+        Clips that fit in a single 30-second Whisper window are padded, stacked
+        into one ``[B, n_mels, N_FRAMES]`` batch and decoded in a single
+        encoder/decoder pass. Longer recordings need Whisper's sliding-window
+        decoding and fall back to :meth:`transcribe_file`. ``preloaded`` takes
+        the output of :meth:`preload_mels` for the same paths.
+        
+        A file that fails on its own gets None in its slot, leaving the other
+        results intact; only a failure of the stacked decode itself raises.
+        """
+        import torch
+        import whisper
+        
+        if preloaded is None:
+            preloaded = self.preload_mels(audio_paths)
+        
+        if len(audio_paths) == 1:
+            return [self._transcribe_or_none(audio_paths[0], preloaded[0][0])]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(audio_paths)
+        batch_indices = []
+        batch_mels = []
+        batch_frames = []
+        
+        for i, (audio_path, (audio, mel)) in enumerate(zip(audio_paths, preloaded)):
+            if mel is None:
+                results[i] = self._transcribe_or_none(audio_path, audio)
+                continue
             
-            logger.success(f"Successfully transcribed: {audio_path}")
-            return result
+            batch_indices.append(i)
+            batch_mels.append(mel)
+            batch_frames.append(audio.shape[0] // whisper.audio.HOP_LENGTH)
+        
+        if not batch_mels:
+            return results
+        
+        try:
+            logger.info("Transcribing batch of {} files", len(batch_mels))
+            
+            mel = self._stack_on_device(batch_mels)
+            with torch.inference_mode(), self._autocast():
+                decoded = whisper.decode(self.model, mel, self._get_decoding_options())
             
+            tokenizer = whisper.tokenizer.get_tokenizer(
+                self.model.is_multilingual, num_languages=self.model.num_languages
+            )
         except Exception as e:
-            logger.error(f"Failed to transcribe {audio_path}: {e}")
+            logger.debug("Failed to transcribe batch: {}", e)
             raise
+        
+        for i, decoding, content_frames in zip(batch_indices, decoded, batch_frames):
+            try:
+                result = self._decoding_to_result(decoding, content_frames, tokenizer)
+                if result is not None:
+                    self._add_metadata(result, audio_paths[i])
+            except Exception as e:
+                logger.debug("Failed to convert batched result for {}: {}", audio_paths[i], e)
+                continue
+            
+            if result is None:
+                # transcribe() would retry this clip at a higher temperature
+                # or decode a second window, so it runs unbatched
+                result = self._transcribe_or_none(audio_paths[i], preloaded[i][0])
+            results[i] = result
+        
+        logger.success("Successfully transcribed batch of {} files", len(batch_mels))
+        return results
+    
+    def _transcribe_or_none(self, audio_path: Path, audio: Any) -> Optional[Dict[str, Any]]:
+        """Transcribe one file of a batch, returning None if it fails."""
+        try:
+            return self.transcribe_file(audio_path, audio)
+        except Exception:
+            # transcribe_file has logged it; the caller decides whether to retry
+            return None
+    
+    def _stack_on_device(self, mels: List["torch.Tensor"]) -> "torch.Tensor":
+        """Stack per-file mels into one batch on the model's device.
+        
+        On CUDA the pinned mels are copied on a side stream, so the transfer
+        does not queue behind kernels still running on the compute stream.
+        """
+        import torch
+        
+        if self._device != "cuda":
+            return torch.stack(mels).to(self.model.device, non_blocking=True)
+        
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream()
+        
+        with torch.cuda.stream(self._copy_stream):
+            mel = torch.stack([m.to(self.model.device, non_blocking=True) for m in mels])
+        
+        compute_stream = torch.cuda.current_stream()
+        compute_stream.wait_stream(self._copy_stream)
+        # Keep the allocator from reusing the batch's memory while compute uses it
+        mel.record_stream(compute_stream)
+        return mel
+    
+    def _check_audio_path(self, audio_path: Path) -> None:
+        """Ensure an audio file exists and has a supported format."""
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        
+        if not self._is_supported_format(audio_path):
+            raise ValueError(f"Unsupported audio format: {audio_path.suffix}")
+    
+    def _add_metadata(self, result: Dict[str, Any], audio_path: Path) -> None:
+        """Attach file and model metadata to a transcription result."""
+        segments = result.get('segments')
+        result['metadata'] = {
+            'file_path': str(audio_path),
+            'file_size': audio_path.stat().st_size,
+            'model': self.config.model,
+            'language': result.get('language', self.config.language),
+            'duration': segments[-1].get('end', 0) if segments else 0
+        }
+    
+    def _decoding_to_result(self, decoding: Any, content_frames: int, tokenizer: Any) -> Optional[Dict[str, Any]]:
+        """Convert a single-window DecodingResult to the transcribe() result shape.
+        
+        Segments are split at the decoded timestamp tokens and silent clips are
+        dropped as transcribe() does. Returns None when transcribe() would
+        handle the clip differently: retrying at a higher temperature, or
+        decoding a second window after an unfinished last segment.
+        """
+        import whisper
+        
+        silent = (
+            decoding.no_speech_prob > _NO_SPEECH_THRESHOLD
+            and decoding.avg_logprob < _LOGPROB_THRESHOLD
+        )
+        needs_fallback = (
+            decoding.compression_ratio > _COMPRESSION_RATIO_THRESHOLD
+            or decoding.avg_logprob < _LOGPROB_THRESHOLD
+        )
+        # Only the default temperature (0.0) gives transcribe() fallbacks to try
+        if needs_fallback and not silent and self.config.temperature == 0.0:
+            return None
+        
+        if decoding.no_speech_prob > _NO_SPEECH_THRESHOLD and not decoding.avg_logprob > _LOGPROB_THRESHOLD:
+            return {'text': '', 'segments': [], 'language': decoding.language}
+        
+        tokens = list(decoding.tokens)
+        timestamp_begin = tokenizer.timestamp_begin
+        # Mel frames and seconds per timestamp token (2 and 0.02 s)
+        input_stride = whisper.audio.FRAMES_PER_SECOND // whisper.audio.TOKENS_PER_SECOND
+        time_precision = input_stride * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+        is_timestamp = [token >= timestamp_begin for token in tokens]
+        
+        # A segment ends wherever two timestamp tokens are adjacent
+        slices = [i for i in range(1, len(tokens)) if is_timestamp[i - 1] and is_timestamp[i]]
+        if slices:
+            if is_timestamp[-2:] == [False, True]:
+                slices.append(len(tokens))
+            elif (tokens[slices[-1] - 1] - timestamp_begin) * input_stride < content_frames:
+                return None
+            
+            bounds = zip([0] + slices, slices)
+            pieces = [
+                (
+                    (tokens[start] - timestamp_begin) * time_precision,
+                    (tokens[end - 1] - timestamp_begin) * time_precision,
+                    tokens[start:end]
+                )
+                for start, end in bounds
+            ]
+        else:
+            end_time = content_frames * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+            timestamps = [token for token in tokens if token >= timestamp_begin]
+            if timestamps and timestamps[-1] != timestamp_begin:
+                end_time = (timestamps[-1] - timestamp_begin) * time_precision
+            pieces = [(0.0, end_time, tokens)]
+        
+        segments = []
+        for i, (start, end, segment_tokens) in enumerate(pieces):
+            text = tokenizer.decode([token for token in segment_tokens if token < tokenizer.eot])
+            if start == end or not text.strip():
+                # transcribe() keeps instantaneous or empty segments, but blank
+                text, segment_tokens = "", []
+            segments.append({
+                'id': i,
+                'seek': 0,
+                'start': start,
+                'end': end,
+                'text': text,
+                'tokens': segment_tokens,
+                'temperature': decoding.temperature,
+                'avg_logprob': decoding.avg_logprob,
+                'compression_ratio': decoding.compression_ratio,
+                'no_speech_prob': decoding.no_speech_prob
+            })
+        
+        return {
+            'text': tokenizer.decode([token for segment in segments for token in segment['tokens']]),
+            'segments': segments,
+            'language': decoding.language
+        }
+    
+    def _get_decoding_options(self) -> "whisper.DecodingOptions":
+        """Get decoding options for batched single-window decoding."""
+        import whisper
+        
+        return whisper.DecodingOptions(
+            language=self.config.language,
+            temperature=self.config.temperature,
+            fp16=self._use_fp16()
+        )
+    
+    def _use_fp16(self) -> bool:
+        """Whether decoding runs in FP16 for the configured compute type."""
+        if self.config.compute_type == "default":
+            return self._device != "cpu"
+        return self.config.compute_type == "float16"
+    
+    def _autocast(self) -> ContextManager:
+        """Autocast FP16 inference on CUDA/MPS so GEMMs run on tensor cores."""
+        import torch
+        
+        if self._device == "cpu" or not self._use_fp16():
+            return contextlib.nullcontext()
+        return torch.autocast(device_type=self._device, dtype=torch.float16)
     
     def _get_transcription_options(self) -> Dict[str, Any]:
         """Get transcription options for Whisper."""
@@ -99,10 +570,9 @@ class WhisperTranscriber:
         if self.config.temperature != 0.0:
             options['temperature'] = self.config.temperature
         
-        # Force FP32 on CPU to avoid warning
-        device = self._get_device()
-        if device == "cpu":
-            options['fp16'] = False
+        # FP16 halves activation traffic on CUDA/MPS; CPU (or float32) stays in
+        # FP32, which also avoids Whisper's FP16-on-CPU warning
+        options['fp16'] = self._use_fp16()
         
         # Add other sampling parameters if they differ from defaults
         decode_options = {}
@@ -125,9 +595,21 @@ class WhisperTranscriber:
         if not self.model:
             return {}
         
+        if self.config.backend == "faster":
+            return {
+                'model_name': self.config.model,
+                'device': self.model.model.device,
+                'is_multilingual': self.model.model.is_multilingual
+            }
+        
+        if self._param_count is None:
+            self._param_count = sum(p.numel() for p in self.model.parameters())
+        
+        # Quantized Linear layers keep packed weights outside parameters()
+        param = next(iter(self.model.parameters()), None)
         return {
             'model_name': self.config.model,
-            'device': str(next(self.model.parameters()).device),
-            'parameters': sum(p.numel() for p in self.model.parameters()),
+            'device': str(param.device) if param is not None else self._device,
+            'parameters': self._param_count,
             'is_multilingual': self.model.is_multilingual
         }
\ No newline at end of file
@@ -0,0 +1,31 @@
+import pytest
+import torch
+import whisper
+from unittest.mock import Mock
+
+from src.transcriber import WhisperTranscriber, _resolve_device
+
+@pytest.fixture(autouse=True)
+def no_whisper_download(monkeypatch):
+    """Never download or load real Whisper weights in tests.
+    
+    Tests that care about the model patch ``whisper.load_model`` themselves;
+    everything else gets a small stand-in with a canned transcription.
+    """
+    def load_model(*args, **kwargs):
+        return Mock(
+            transcribe=Mock(return_value={'text': '', 'segments': [], 'language': 'en'}),
+            parameters=lambda: iter([torch.zeros(1)]),
+            is_multilingual=False
+        )
+    
+    monkeypatch.setattr(whisper, "load_model", load_model)
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    """Keep models and devices cached by one test from leaking into the next."""
+    WhisperTranscriber.clear_cache()
+    _resolve_device.cache_clear()
+    yield
+    WhisperTranscriber.clear_cache()
+    _resolve_device.cache_clear()
@@ -0,0 +1,214 @@
+import threading
+import pytest
+from unittest.mock import call, patch
+
+from src.app import TranscriptionApp
+from src.config import TranscriptionConfig
+
+class TestTranscriptionApp:
+    """Test cases for TranscriptionApp."""
+    
+    @pytest.fixture
+    def audio_files(self, tmp_path):
+        """Create test audio files."""
+        files = []
+        for name in ["audio1.mp3", "audio2.wav"]:
+            file_path = tmp_path / name
+            file_path.write_bytes(b"fake audio data")
+            files.append(file_path)
+        return files
+    
+    @pytest.fixture
+    def batched_files(self, tmp_path):
+        """Create four files of distinct sizes, named in largest-first order."""
+        files = []
+        for name, size in [("a.mp3", 400), ("b.mp3", 300), ("c.mp3", 200), ("d.mp3", 100)]:
+            file_path = tmp_path / name
+            file_path.write_bytes(b"0" * size)
+            files.append(file_path)
+        return files
+    
+    @pytest.fixture
+    def mock_transcriber(self):
+        """Mock WhisperTranscriber whose results carry the audio file's stem."""
+        def result_for(path):
+            return {'text': path.stem, 'segments': [], 'language': 'en'}
+        
+        with patch('src.app.WhisperTranscriber') as mock_transcriber_class:
+            transcriber = mock_transcriber_class.return_value
+            transcriber.preload_mels.side_effect = lambda paths: [(f"audio-{p.stem}", "mel") for p in paths]
+            transcriber.transcribe_files.side_effect = lambda paths, preloaded: [result_for(p) for p in paths]
+            transcriber.transcribe_file.side_effect = lambda path, audio=None: result_for(path)
+            yield transcriber
+    
+    @pytest.fixture
+    def saved(self):
+        """Record (output name, text) for every result the writer saves."""
+        saved = []
+        with patch('src.app.save_result_streaming') as mock_save:
+            mock_save.side_effect = lambda result, output_path, *args: saved.append(
+                (output_path.name, result['text'])
+            )
+            yield saved
+    
+    @staticmethod
+    def _expected(files):
+        return [(f"{f.stem}_transcription.md", f.stem) for f in files]
+    
+    @patch('src.app.WhisperTranscriber')
+    def test_run_all_transcribed_skips_model_load(self, mock_transcriber_class, audio_files, tmp_path, capsys):
+        """Test a run with nothing left to transcribe never loads the model."""
+        for audio_file in audio_files:
+            (tmp_path / f"{audio_file.stem}_transcription.md").write_text("Done")
+        
+        TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path)).run()
+        
+        mock_transcriber_class.assert_not_called()
+        output = capsys.readouterr().out
+        assert "2 files already transcribed (use --no-skip-existing)" in output
+        assert "No audio files found" not in output
+    
+    @patch('src.app.WhisperTranscriber')
+    def test_run_empty_folder(self, mock_transcriber_class, tmp_path, capsys):
+        """Test a folder without audio files reports that nothing was found."""
+        TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path)).run()
+        
+        mock_transcriber_class.assert_not_called()
+        assert "No audio files found to transcribe." in capsys.readouterr().out
+    
+    @patch('src.app.WhisperTranscriber')
+    def test_run_named_file_with_existing_output(self, mock_transcriber_class, audio_files, tmp_path):
+        """Test an explicitly named file is transcribed again."""
+        output_path = tmp_path / "audio1_transcription.md"
+        output_path.write_text("old")
+        mock_transcriber_class.return_value.transcribe_file.return_value = {
+            'text': 'New', 'segments': [], 'language': 'en'
+        }
+        
+        TranscriptionApp(TranscriptionConfig(audio_file=audio_files[0])).run()
+        
+        mock_transcriber_class.return_value.transcribe_file.assert_called_once()
+        assert "New" in output_path.read_text()
+    
+    def test_batches_saved_in_order(self, batched_files, mock_transcriber, saved, tmp_path):
+        """Test batched results are written in batch order."""
+        TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path, batch_size=2)).run()
+        
+        assert saved == self._expected(batched_files)
+        assert mock_transcriber.transcribe_files.call_count == 2
+        mock_transcriber.transcribe_file.assert_not_called()
+    
+    def test_failed_preload_transcribes_files_individually(self, batched_files, mock_transcriber, saved, tmp_path):
+        """Test a batch whose audio could not be preloaded falls back to transcribe_file."""
+        preload = mock_transcriber.preload_mels.side_effect
+        
+        def failing_preload(paths):
+            if paths[0].name == "a.mp3":
+                raise RuntimeError("ffmpeg failed")
+            return preload(paths)
+        
+        mock_transcriber.preload_mels.side_effect = failing_preload
+        
+        TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path, batch_size=2)).run()
+        
+        assert saved == self._expected(batched_files)
+        assert mock_transcriber.transcribe_file.call_args_list == [
+            call(batched_files[0], None), call(batched_files[1], None)
+        ]
+        mock_transcriber.transcribe_files.assert_called_once()
+    
+    def test_failed_batch_transcribes_files_individually(self, batched_files, mock_transcriber, saved, tmp_path):
+        """Test a failed batch pass degrades to one result per file."""
+        mock_transcriber.transcribe_files.side_effect = RuntimeError("CUDA out of memory")
+        
+        TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path, batch_size=2)).run()
+        
+        assert saved == self._expected(batched_files)
+        # Each retry reuses the audio decoded for the failed batch
+        assert mock_transcriber.transcribe_file.call_args_list == [
+            call(f, f"audio-{f.stem}") for f in batched_files
+        ]
+    
+    def test_failed_file_in_batch_retried_alone(self, batched_files, mock_transcriber, saved, tmp_path):
+        """Test a None slot from transcribe_files retries only that file."""
+        transcribe_files = mock_transcriber.transcribe_files.side_effect
+        
+        def partial_batch(paths, preloaded):
+            results = transcribe_files(paths, preloaded)
+            if paths[0].name == "a.mp3":
+                results[1] = None
+            return results
+        
+        mock_transcriber.transcribe_files.side_effect = partial_batch
+        
+        TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path, batch_size=2)).run()
+        
+        assert saved == self._expected(batched_files)
+        assert mock_transcriber.transcribe_file.call_args_list == [call(batched_files[1], "audio-b")]
+    
+    @staticmethod
+    def _writer_alive():
+        return any(t.name == "transcription-writer" for t in threading.enumerate())
+    
+    def test_writer_drains_queue_before_run_returns(self, batched_files, mock_transcriber, saved, tmp_path):
+        """Test every queued result is saved and the writer joined when run() returns."""
+        app = TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path, batch_size=1))
+        app.run()
+        
+        assert saved == self._expected(batched_files)
+        assert app._writer is None
+        assert not self._writer_alive()
+    
+    def test_writer_drains_queue_when_batch_raises(self, batched_files, mock_transcriber, saved, tmp_path):
+        """Test results queued before an escaping error are still saved."""
+        preload = mock_transcriber.preload_mels.side_effect
+        
+        def interrupted_preload(paths):
+            if paths[0].name == "c.mp3":
+                raise KeyboardInterrupt
+            return preload(paths)
+        
+        mock_transcriber.preload_mels.side_effect = interrupted_preload
+        app = TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path, batch_size=2))
+        
+        with pytest.raises(KeyboardInterrupt):
+            app.run()
+        
+        assert saved == self._expected(batched_files[:2])
+        assert app._writer is None
+        assert not self._writer_alive()
+    
+    @patch('src.app.logger')
+    def test_writer_continues_after_save_error(self, mock_logger, batched_files, mock_transcriber, tmp_path):
+        """Test a failed save is logged and the remaining results are still written."""
+        saved = []
+        with patch('src.app.save_result_streaming') as mock_save:
+            def save(result, output_path, *args):
+                if result['text'] == "b":
+                    raise OSError("disk full")
+                saved.append((output_path.name, result['text']))
+            
+            mock_save.side_effect = save
+            TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path)).run()
+        
+        assert saved == self._expected([batched_files[0], *batched_files[2:]])
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.args[0] == "Failed to save {}: {}"
+        assert not self._writer_alive()
+    
+    def test_quiet_mode_reports_file_failure_once(self, batched_files, mock_transcriber, saved, tmp_path, capsys):
+        """Test a failed file is reported on stderr exactly once without --verbose."""
+        transcribe = mock_transcriber.transcribe_file.side_effect
+        
+        def failing_transcribe(path, audio=None):
+            if path.name == "b.mp3":
+                raise RuntimeError("corrupt audio")
+            return transcribe(path, audio)
+        
+        mock_transcriber.transcribe_file.side_effect = failing_transcribe
+        
+        TranscriptionApp(TranscriptionConfig(audio_folder=tmp_path)).run()
+        
+        assert saved == self._expected([batched_files[0], *batched_files[2:]])
+        assert capsys.readouterr().err.count("corrupt audio") == 1
+
@@ -15,13 +15,13 @@ class TestCLI:
     
     def test_models_info_flag(self, runner):
         """Test --models-info flag."""
-        with patch('src.cli.TranscriptionApp') as mock_app_class:
-            mock_app = mock_app_class.return_value
-            
+        with patch('src.formatters.show_model_info') as mock_show_model_info, \
+                patch('src.app.TranscriptionApp') as mock_app_class:
             result = runner.invoke(main, ['--models-info'])
             
             assert result.exit_code == 0
-            mock_app.show_model_info.assert_called_once()
+            mock_show_model_info.assert_called_once()
+            mock_app_class.assert_not_called()
     
     def test_single_file_transcription(self, runner, tmp_path):
         """Test transcribing a single file."""
@@ -29,7 +29,7 @@ class TestCLI:
         audio_file = tmp_path / "test.mp3"
         audio_file.touch()
         
-        with patch('src.cli.TranscriptionApp') as mock_app_class:
+        with patch('src.app.TranscriptionApp') as mock_app_class:
             mock_app = mock_app_class.return_value
             
             result = runner.invoke(main, [
@@ -51,13 +51,17 @@ class TestCLI:
     
     def test_folder_transcription(self, runner, tmp_path):
         """Test transcribing files in a folder."""
-        with patch('src.cli.TranscriptionApp') as mock_app_class:
+        with patch('src.app.TranscriptionApp') as mock_app_class:
             mock_app = mock_app_class.return_value
             
             result = runner.invoke(main, [
                 '--audio-folder', str(tmp_path),
                 '--recursive',
                 '--batch-size', '3',
+                '--bucket-by', 'duration',
+                '--discover-workers', '8',
+                '--backend', 'faster',
+                '--compute-type', 'int8',
                 '--output-format', 'json'
             ])
             
@@ -69,6 +73,10 @@ class TestCLI:
             assert config.audio_folder == tmp_path
             assert config.recursive is True
             assert config.batch_size == 3
+            assert config.bucket_by == 'duration'
+            assert config.discover_workers == 8
+            assert config.backend == 'faster'
+            assert config.compute_type == 'int8'
             assert config.output_format == 'json'
     
     def test_custom_whisper_parameters(self, runner, tmp_path):
@@ -76,7 +84,7 @@ class TestCLI:
         audio_file = tmp_path / "test.wav"
         audio_file.touch()
         
-        with patch('src.cli.TranscriptionApp') as mock_app_class:
+        with patch('src.app.TranscriptionApp') as mock_app_class:
             mock_app = mock_app_class.return_value
             
             result = runner.invoke(main, [
@@ -110,7 +118,7 @@ class TestCLI:
         transcribe_folder = tmp_path / "transcriptions"
         transcription_file = tmp_path / "custom_output.md"
         
-        with patch('src.cli.TranscriptionApp') as mock_app_class:
+        with patch('src.app.TranscriptionApp') as mock_app_class:
             mock_app = mock_app_class.return_value
             
             result = runner.invoke(main, [
@@ -170,7 +178,7 @@ class TestCLI:
         audio_file = tmp_path / "test.mp3"
         audio_file.touch()
         
-        with patch('src.cli.TranscriptionApp') as mock_app_class:
+        with patch('src.app.TranscriptionApp') as mock_app_class:
             mock_app = mock_app_class.return_value
             mock_app.run.side_effect = Exception("Test error")
             
@@ -179,6 +187,7 @@ class TestCLI:
             ])
             
             assert result.exit_code == 1  # ClickException
+            assert result.output.count('Test error') == 1
             assert 'Error: Test error' in result.output
     
     def test_nonexistent_audio_file(self, runner):
@@ -219,7 +228,7 @@ class TestCLI:
         audio_file = tmp_path / "test.mp3"
         audio_file.touch()
         
-        with patch('src.cli.TranscriptionApp') as mock_app_class:
+        with patch('src.app.TranscriptionApp') as mock_app_class:
             mock_app = mock_app_class.return_value
             
             result = runner.invoke(main, [
@@ -240,4 +249,5 @@ class TestCLI:
             assert config.batch_size == 1
             assert config.max_length is None
             assert config.recursive is False
+            assert config.skip_existing is True
             assert config.verbose is False
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pytest
+from dataclasses import FrozenInstanceError
 from pathlib import Path
-from pydantic import ValidationError
 
 from src.config import TranscriptionConfig
 
@@ -54,51 +54,96 @@ class TestTranscriptionConfig:
     
     def test_invalid_temperature(self):
         """Test invalid temperature values."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), temperature=-0.1)
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), temperature=1.1)
     
     def test_invalid_top_p(self):
         """Test invalid top_p values."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), top_p=-0.1)
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), top_p=1.1)
     
     def test_invalid_batch_size(self):
         """Test invalid batch size."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), batch_size=0)
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), batch_size=-1)
     
     def test_invalid_max_length(self):
         """Test invalid max length."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), max_length=0)
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), max_length=-1)
     
     def test_invalid_top_k(self):
         """Test invalid top_k values."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), top_k=0)
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             TranscriptionConfig(audio_file=Path("test.mp3"), top_k=-1)
     
+    def test_invalid_output_format(self):
+        """Test invalid output format."""
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            TranscriptionConfig(audio_file=Path("test.mp3"), output_format="doc")
+    
+    def test_invalid_compute_type(self):
+        """Test invalid compute type."""
+        with pytest.raises(ValueError, match="Unsupported compute type"):
+            TranscriptionConfig(audio_file=Path("test.mp3"), compute_type="int4")
+    
+    def test_faster_only_compute_type(self):
+        """Test CTranslate2-only compute types require the faster backend."""
+        with pytest.raises(ValueError, match="requires the faster backend"):
+            TranscriptionConfig(audio_file=Path("test.mp3"), compute_type="int8_float16")
+        
+        config = TranscriptionConfig(audio_file=Path("test.mp3"), backend="faster", compute_type="int8_float16")
+        assert config.compute_type == "int8_float16"
+    
+    def test_compile_model_requires_openai_backend(self):
+        """Test torch.compile is only offered for the PyTorch backend."""
+        with pytest.raises(ValueError, match="compile_model requires the openai backend"):
+            TranscriptionConfig(audio_file=Path("test.mp3"), backend="faster", compile_model=True)
+    
+    def test_faster_backend_rejects_mps(self):
+        """Test the faster backend cannot run on MPS."""
+        with pytest.raises(ValueError, match="does not support the mps device"):
+            TranscriptionConfig(audio_file=Path("test.mp3"), backend="faster", device="mps")
+    
+    def test_config_is_immutable(self):
+        """Test configuration cannot be changed after construction."""
+        config = TranscriptionConfig(audio_file=Path("test.mp3"))
+        
+        with pytest.raises(FrozenInstanceError):
+            config.batch_size = 2
+    
+    def test_path_fields_coerced(self):
+        """Test string paths are converted to Path objects."""
+        config = TranscriptionConfig(audio_file="test.mp3", transcribe_folder="out")
+        
+        assert config.audio_file == Path("test.mp3")
+        assert config.transcribe_folder == Path("out")
+    
     def test_supported_extensions(self):
         """Test supported audio extensions."""
         config = TranscriptionConfig(audio_file=Path("test.mp3"))
         extensions = config.supported_extensions
         
-        expected_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.mp4', '.mkv', '.avi'}
+        expected_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.opus', '.wma', '.aac', '.mp4', '.mkv', '.avi'}
         assert extensions == expected_extensions
+        # One shared frozenset on the class, not rebuilt per instance or access
+        assert isinstance(extensions, frozenset)
+        assert extensions is TranscriptionConfig.supported_extensions
     
     def test_validate_paths_no_source(self):
         """Test validation with no audio source."""
@@ -1,6 +1,8 @@
+import os
 import pytest
+from dataclasses import replace
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.config import TranscriptionConfig
 from src.file_processor import AudioFileProcessor
@@ -66,6 +68,26 @@ class TestAudioFileProcessor:
         assert any(f.name == "audio1.mp3" for f in files)
         assert any(f.name == "audio2.wav" for f in files)
     
+    def test_discover_audio_files_unreadable_subdirectory(self, tmp_path):
+        """Test an unreadable subdirectory is skipped without ending discovery."""
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / "hidden.mp3").touch()
+        (tmp_path / "audio1.mp3").touch()
+        
+        scandir = os.scandir
+        
+        def failing_scandir(path):
+            if Path(path) == locked:
+                raise PermissionError("Permission denied")
+            return scandir(path)
+        
+        config = TranscriptionConfig(audio_folder=tmp_path, recursive=True)
+        with patch('src.file_processor.os.scandir', side_effect=failing_scandir):
+            files = AudioFileProcessor(config).discover_audio_files()
+        
+        assert [f.name for f in files] == ["audio1.mp3"]
+    
     def test_discover_audio_files_non_recursive(self, tmp_path):
         """Test non-recursive audio file discovery."""
         # Create nested structure
@@ -82,6 +104,35 @@ class TestAudioFileProcessor:
         assert len(files) == 1
         assert files[0].name == "audio1.mp3"
     
+    def test_discover_audio_files_single_worker(self, config_with_folder, audio_files):
+        """Test discovery without a thread pool finds the same files."""
+        config = TranscriptionConfig(audio_folder=config_with_folder.audio_folder, discover_workers=1)
+        processor = AudioFileProcessor(config)
+        
+        assert processor.discover_audio_files() == AudioFileProcessor(config_with_folder).discover_audio_files()
+    
+    def test_discover_audio_files_skips_existing(self, config_with_folder, audio_files, tmp_path):
+        """Test files with an existing transcription are skipped, but not empty outputs."""
+        (tmp_path / "audio1_transcription.md").write_text("Done")
+        (tmp_path / "audio2_transcription.md").touch()
+        
+        processor = AudioFileProcessor(config_with_folder)
+        files = processor.discover_audio_files()
+        assert sorted(f.name for f in files) == ["audio2.wav", "audio3.m4a"]
+        assert processor.skipped_existing == 1
+        
+        config = replace(config_with_folder, skip_existing=False)
+        assert len(AudioFileProcessor(config).discover_audio_files()) == 3
+    
+    def test_discover_audio_files_never_skips_named_file(self, config_with_file, tmp_path):
+        """Test an explicitly named file is transcribed even if its output exists."""
+        (tmp_path / "test_transcription.md").touch()
+        
+        processor = AudioFileProcessor(config_with_file)
+        
+        assert processor.discover_audio_files() == [config_with_file.audio_file]
+        assert processor.skipped_existing == 0
+    
     def test_discover_audio_files_no_source(self):
         """Test discovery with no audio source."""
         config = TranscriptionConfig()
@@ -92,7 +143,7 @@ class TestAudioFileProcessor:
     
     def test_get_output_path_single_file_specified(self, config_with_file):
         """Test output path for single file with specified output."""
-        config_with_file.transcription_file = Path("custom_output.md")
+        config_with_file = replace(config_with_file, transcription_file=Path("custom_output.md"))
         processor = AudioFileProcessor(config_with_file)
         
         output_path = processor.get_output_path(config_with_file.audio_file, "md")
@@ -108,7 +159,7 @@ class TestAudioFileProcessor:
     
     def test_get_output_path_custom_folder(self, config_with_file, tmp_path):
         """Test output path in custom folder."""
-        config_with_file.transcribe_folder = tmp_path / "transcriptions"
+        config_with_file = replace(config_with_file, transcribe_folder=tmp_path / "transcriptions")
         processor = AudioFileProcessor(config_with_file)
         
         output_path = processor.get_output_path(config_with_file.audio_file, "json")
@@ -128,7 +179,7 @@ class TestAudioFileProcessor:
     
     def test_batch_files(self, config_with_file):
         """Test file batching."""
-        config_with_file.batch_size = 2
+        config_with_file = replace(config_with_file, batch_size=2)
         processor = AudioFileProcessor(config_with_file)
         
         files = [Path(f"file{i}.mp3") for i in range(5)]
@@ -139,6 +190,85 @@ class TestAudioFileProcessor:
         assert len(batches[1]) == 2
         assert len(batches[2]) == 1
     
+    def test_batch_files_largest_first_by_default(self, tmp_path):
+        """Test batches are ordered by size, largest first, without --bucket-by."""
+        for name, size in [("a.mp3", 10), ("b.mp3", 3000), ("c.mp3", 200)]:
+            (tmp_path / name).write_bytes(b'0' * size)
+        
+        config = TranscriptionConfig(audio_folder=tmp_path, batch_size=2)
+        processor = AudioFileProcessor(config)
+        files = processor.discover_audio_files()
+        
+        # Discovery keeps path order; batching does the size ordering
+        assert [f.name for f in files] == ["a.mp3", "b.mp3", "c.mp3"]
+        assert [[f.name for f in batch] for batch in processor.batch_files(files)] == [
+            ["b.mp3", "c.mp3"], ["a.mp3"]
+        ]
+    
+    def test_batch_files_bucket_by_size(self, tmp_path):
+        """Test size bucketing batches similarly sized files together."""
+        files = []
+        for i, size in enumerate([10, 5000, 20, 4000]):
+            file_path = tmp_path / f"audio{i}.mp3"
+            file_path.write_bytes(b'0' * size)
+            files.append(file_path)
+        
+        config = TranscriptionConfig(audio_folder=tmp_path, batch_size=2, bucket_by="size")
+        processor = AudioFileProcessor(config)
+        batches = list(processor.batch_files(files))
+        
+        assert batches == [[files[1], files[3]], [files[2], files[0]]]
+    
+    def test_batch_files_bucket_by_duration(self, tmp_path):
+        """Test duration bucketing never mixes short and long files."""
+        durations = {"a.mp3": 5.0, "b.mp3": 600.0, "c.mp3": 8.0, "d.mp3": 20.0}
+        files = [tmp_path / name for name in durations]
+        
+        config = TranscriptionConfig(audio_folder=tmp_path, batch_size=4, bucket_by="duration")
+        processor = AudioFileProcessor(config)
+        processor._probe_duration = Mock(side_effect=lambda path: durations[path.name])
+        with patch('src.file_processor.shutil.which', return_value="/usr/bin/ffprobe"):
+            batches = list(processor.batch_files(files))
+        
+        assert batches == [
+            [files[2], files[0]],
+            [files[3]],
+            [files[1]]
+        ]
+    
+    @pytest.fixture
+    def sized_files(self, tmp_path):
+        """Create three files whose size order is b, c, a."""
+        files = []
+        for name, size in [("a.mp3", 10), ("b.mp3", 3000), ("c.mp3", 200)]:
+            file_path = tmp_path / name
+            file_path.write_bytes(b'0' * size)
+            files.append(file_path)
+        return files
+    
+    def test_batch_files_bucket_by_duration_without_ffprobe(self, sized_files, tmp_path):
+        """Test duration bucketing falls back to size order when ffprobe is missing."""
+        config = TranscriptionConfig(audio_folder=tmp_path, batch_size=2, bucket_by="duration")
+        processor = AudioFileProcessor(config)
+        processor._probe_duration = Mock()
+        with patch('src.file_processor.shutil.which', return_value=None):
+            batches = list(processor.batch_files(sized_files))
+        
+        assert batches == [[sized_files[1], sized_files[2]], [sized_files[0]]]
+        processor._probe_duration.assert_not_called()
+    
+    def test_batch_files_bucket_by_duration_probe_failure(self, sized_files, tmp_path):
+        """Test duration bucketing falls back to size order when a probe fails."""
+        durations = {"a.mp3": 5.0, "b.mp3": None, "c.mp3": 8.0}
+        config = TranscriptionConfig(audio_folder=tmp_path, batch_size=2, bucket_by="duration")
+        processor = AudioFileProcessor(config)
+        processor._probe_duration = Mock(side_effect=lambda path: durations[path.name])
+        with patch('src.file_processor.shutil.which', return_value="/usr/bin/ffprobe"):
+            batches = list(processor.batch_files(sized_files))
+        
+        assert batches == [[sized_files[1], sized_files[2]], [sized_files[0]]]
+        assert processor._probe_duration.call_count == 3
+    
     def test_validate_output_path_success(self, config_with_file, tmp_path):
         """Test successful output path validation."""
         processor = AudioFileProcessor(config_with_file)
@@ -159,6 +289,26 @@ class TestAudioFileProcessor:
         processor.validate_output_path(output_path)
         assert output_path.parent.exists()
     
+    def test_validate_output_path_not_writable(self, config_with_file, tmp_path):
+        """Test output path validation rejects read-only directories."""
+        processor = AudioFileProcessor(config_with_file)
+        output_path = tmp_path / "output.md"
+        
+        with patch('src.file_processor.os.access', return_value=False):
+            with pytest.raises(PermissionError, match="No write permission"):
+                processor.validate_output_path(output_path)
+    
+    def test_validate_output_path_caches_directory(self, config_with_file, tmp_path):
+        """Test output directories are only checked once."""
+        processor = AudioFileProcessor(config_with_file)
+        
+        with patch('src.file_processor.os.access', return_value=True) as mock_access:
+            processor.validate_output_path(tmp_path / "a.md")
+            processor.validate_output_path(tmp_path / "b.md")
+        
+        mock_access.assert_called_once()
+        assert not (tmp_path / ".write_test").exists()
+    
     def test_get_file_stats(self, config_with_file, tmp_path):
         """Test file statistics calculation."""
         # Create test files
@@ -176,6 +326,19 @@ class TestAudioFileProcessor:
         assert stats['file_types'] == {'.mp3': 1, '.wav': 1, '.m4a': 1}
         assert stats['batch_count'] == 3  # batch_size = 1
     
+    def test_get_file_stats_batch_count(self, tmp_path):
+        """Test batch count is derived without materializing batches."""
+        files = [tmp_path / f"audio{i}.mp3" for i in range(5)]
+        for file_path in files:
+            file_path.write_bytes(b'0' * 1024)
+        
+        config = TranscriptionConfig(audio_folder=tmp_path, batch_size=2)
+        processor = AudioFileProcessor(config)
+        stats = processor.get_file_stats(files)
+        
+        assert stats['batch_count'] == len(list(processor.batch_files(files))) == 3
+        assert stats['file_types'] == {'.mp3': 5}
+    
     def test_is_audio_file(self, config_with_file):
         """Test audio file detection."""
         processor = AudioFileProcessor(config_with_file)
@@ -2,8 +2,11 @@ import pytest
 import json
 from pathlib import Path
 from datetime import datetime
+from typing import get_args
+from unittest.mock import Mock, patch
 
-from src.formatters import OutputFormatter
+from src.config import OutputFormat
+from src.formatters import FORMATTERS, OutputFormatter
 
 class TestOutputFormatter:
     """Test cases for OutputFormatter."""
@@ -50,6 +53,24 @@ class TestOutputFormatter:
         assert '[0.00s - 2.50s]' in content
         assert '[2.50s - 5.00s]' in content
     
+    def test_format_markdown_exact_output(self, sample_result):
+        """Test the full markdown layout, so template changes cannot drift."""
+        content = OutputFormatter.format_markdown(sample_result, "2024-01-01T00:00:00")
+        
+        assert content == (
+            "# Transcription\n\n"
+            "**File:** /path/to/audio.mp3\n"
+            "**Model:** base\n"
+            "**Language:** en\n"
+            "**Duration:** 5.00 seconds\n"
+            "**Generated:** 2024-01-01T00:00:00\n\n"
+            "## Content\n\n"
+            "Hello, this is a test transcription.\n"
+            "\n## Segments\n\n"
+            "**1.** [0.00s - 2.50s] Hello, this is a test\n\n"
+            "**2.** [2.50s - 5.00s] transcription.\n\n"
+        )
+    
     def test_format_text(self, sample_result):
         """Test plain text formatting."""
         content = OutputFormatter.format_text(sample_result)
@@ -77,6 +98,30 @@ class TestOutputFormatter:
         # Verify timestamp format
         datetime.fromisoformat(data['generated_at'])
     
+    def test_format_json_without_orjson(self, sample_result):
+        """Test the stdlib json fallback produces the same document."""
+        from unittest.mock import patch
+        
+        expected = json.loads(OutputFormatter.format_json(dict(sample_result), "2024-01-01T00:00:00"))
+        with patch('src.formatters.orjson', None):
+            content = OutputFormatter.format_json(dict(sample_result), "2024-01-01T00:00:00")
+        
+        assert json.loads(content) == expected
+    
+    def test_format_json_numpy_values(self, sample_result):
+        """Test NumPy scalars from model output serialize as plain numbers."""
+        import numpy as np
+        
+        from unittest.mock import patch
+        
+        sample_result['segments'][0]['avg_logprob'] = np.float32(-0.25)
+        data = json.loads(OutputFormatter.format_json(sample_result))
+        with patch('src.formatters.orjson', None):
+            fallback = json.loads(OutputFormatter.format_json(sample_result))
+        
+        assert data['segments'][0]['avg_logprob'] == -0.25
+        assert fallback['segments'][0]['avg_logprob'] == -0.25
+    
     def test_format_srt(self, sample_result):
         """Test SRT subtitle formatting."""
         content = OutputFormatter.format_srt(sample_result)
@@ -148,15 +193,58 @@ class TestOutputFormatter:
         assert OutputFormatter._format_vtt_time(61.123) == "00:01:01.123"
         assert OutputFormatter._format_vtt_time(3661.999) == "01:01:01.999"
     
+    def test_subtitles_with_many_segments_match_scalar_formatting(self):
+        """Test the vectorized timestamp path matches per-segment formatting."""
+        segments = [
+            {'start': i * 61.123, 'end': i * 61.123 + 0.0005, 'text': f' Line {i}'}
+            for i in range(300)
+        ]
+        result = {'text': '', 'segments': segments}
+        
+        srt_lines = OutputFormatter.format_srt(result).split('\n')
+        vtt_lines = OutputFormatter.format_vtt(result).split('\n')
+        
+        for i, segment in enumerate(segments):
+            start, end = segment['start'], segment['end']
+            assert srt_lines[4 * i + 1] == (
+                f"{OutputFormatter._format_srt_time(start)} --> {OutputFormatter._format_srt_time(end)}"
+            )
+            assert vtt_lines[2 + 3 * i] == (
+                f"{OutputFormatter._format_vtt_time(start)} --> {OutputFormatter._format_vtt_time(end)}"
+            )
+    
+    def test_vectorized_timestamps_match_scalar_formatting(self):
+        """Test the NumPy timestamp path, including >= 100 hours, matches _format_timestamp."""
+        from unittest.mock import patch
+        from src.formatters import _format_timestamp, _format_timestamps
+        
+        short = [0.0, 0.0005, 1.5, 61.123, 3661.999, 359999.9994]
+        long = short + [360000.0]
+        
+        with patch('src.formatters._VECTORIZE_MIN_TIMESTAMPS', 1):
+            assert _format_timestamps(short, ',') == [_format_timestamp(t, ',') for t in short]
+            assert _format_timestamps(long, '.') == [_format_timestamp(t, '.') for t in long]
+    
     def test_format_result_all_formats(self, sample_result):
         """Test format_result method with all formats."""
-        formats = ['md', 'txt', 'json', 'srt', 'vtt']
+        formats = get_args(OutputFormat)
+        # The dispatch table covers exactly the formats the config accepts
+        assert set(FORMATTERS) == set(formats)
         
         for fmt in formats:
             content = OutputFormatter.format_result(sample_result, fmt)
             assert isinstance(content, str)
             assert len(content) > 0
     
+    def test_format_result_uses_given_timestamp(self, sample_result):
+        """Test a run-wide timestamp is used instead of the current time."""
+        generated_at = "2024-01-02T03:04:05"
+        
+        assert f"**Generated:** {generated_at}" in OutputFormatter.format_result(sample_result, 'md', generated_at)
+        assert f"Generated: {generated_at}" in OutputFormatter.format_result(sample_result, 'txt', generated_at)
+        data = json.loads(OutputFormatter.format_result(sample_result, 'json', generated_at))
+        assert data['generated_at'] == generated_at
+    
     def test_format_result_invalid_format(self, sample_result):
         """Test format_result with invalid format."""
         with pytest.raises(ValueError, match="Unsupported output format: invalid"):
@@ -195,6 +283,70 @@ class TestOutputFormatter:
         saved_content = output_path.read_text(encoding='utf-8')
         assert saved_content == content
     
+    def test_save_result_large_content(self, tmp_path):
+        """Test large transcripts are written intact."""
+        output_path = tmp_path / "large.txt"
+        content = "Segment ünïcode text.\n" * 20000
+        
+        OutputFormatter.save_result(content, output_path)
+        
+        assert output_path.read_text(encoding='utf-8') == content
+    
+    def test_save_result_truncates_existing_file(self, tmp_path):
+        """Test overwriting a longer file leaves none of its old content."""
+        output_path = tmp_path / "output.txt"
+        output_path.write_text("Old transcription " * 100, encoding='utf-8')
+        
+        OutputFormatter.save_result("New", output_path)
+        
+        assert output_path.read_text(encoding='utf-8') == "New"
+    
+    def test_save_result_streaming_failure_keeps_existing_file(self, sample_result, tmp_path):
+        """Test a write that fails midway leaves the previous output and no temp file."""
+        output_path = tmp_path / "result.srt"
+        output_path.write_text("Old transcription", encoding='utf-8')
+        
+        def failing_stream(result, fp):
+            fp.write("1\n")
+            raise OSError("No space left on device")
+        
+        with patch.dict('src.formatters._STREAMERS', {'srt': failing_stream}):
+            with pytest.raises(RuntimeError, match="No space left on device"):
+                OutputFormatter.save_result_streaming(sample_result, output_path, 'srt')
+        
+        assert output_path.read_text(encoding='utf-8') == "Old transcription"
+        assert list(tmp_path.iterdir()) == [output_path]
+    
+    def test_save_result_streaming_json(self, sample_result, tmp_path):
+        """Test JSON results are streamed straight to disk."""
+        output_path = tmp_path / "nested" / "result.json"
+        
+        OutputFormatter.save_result_streaming(sample_result, output_path, 'json')
+        
+        data = json.loads(output_path.read_text(encoding='utf-8'))
+        assert data['text'] == sample_result['text']
+        assert data['segments'] == sample_result['segments']
+        datetime.fromisoformat(data['generated_at'])
+    
+    def test_save_result_streaming_other_formats(self, sample_result, tmp_path):
+        """Test non-JSON formats match format_result output."""
+        for output_format in ('srt', 'vtt', 'md'):
+            output_path = tmp_path / f"result.{output_format}"
+            
+            OutputFormatter.save_result_streaming(sample_result, output_path, output_format, '2024-01-01T00:00:00')
+            
+            expected = OutputFormatter.format_result(sample_result, output_format, '2024-01-01T00:00:00')
+            assert output_path.read_bytes() == expected.encode('utf-8')
+    
+    def test_stream_subtitles_to_file_object(self, sample_result):
+        """Test subtitle cues are written to a file object one at a time."""
+        fp = Mock()
+        
+        OutputFormatter.stream_srt(sample_result, fp)
+        
+        assert fp.write.call_count == len(sample_result['segments'])
+        assert "".join(c.args[0] for c in fp.write.call_args_list) == OutputFormatter.format_srt(sample_result)
+    
     def test_markdown_format_without_segments(self):
         """Test markdown formatting without segments."""
         result = {
@@ -1,9 +1,10 @@
+import sys
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
 from src.config import TranscriptionConfig
-from src.transcriber import WhisperTranscriber
+from src.transcriber import WhisperTranscriber, _physical_cores
 
 class TestWhisperTranscriber:
     """Test cases for WhisperTranscriber."""
@@ -22,14 +23,21 @@ class TestWhisperTranscriber:
         """Mock Whisper model."""
         mock_model = Mock()
         mock_model.is_multilingual = True
+        mock_model.num_languages = 99
         mock_model.parameters.return_value = [Mock()]
         mock_model.parameters.return_value[0].device = "cpu"
         mock_model.parameters.return_value[0].numel.return_value = 1000000
         return mock_model
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_init_loads_model(self, mock_torch, mock_load_model, config, mock_whisper_model):
+    @pytest.fixture
+    def mock_torch(self, monkeypatch):
+        """Mock torch module, seen by the transcriber's function-local imports."""
+        mock_torch = MagicMock()
+        monkeypatch.setitem(sys.modules, 'torch', mock_torch)
+        return mock_torch
+    
+    @patch('whisper.load_model')
+    def test_init_loads_model(self, mock_load_model, config, mock_whisper_model, mock_torch):
         """Test that initialization loads the Whisper model."""
         mock_torch.cuda.is_available.return_value = False
         mock_torch.backends.mps.is_available.return_value = False
@@ -40,9 +48,8 @@ class TestWhisperTranscriber:
         mock_load_model.assert_called_once_with("base", device="cpu")
         assert transcriber.model == mock_whisper_model
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_get_device_cuda(self, mock_torch, mock_load_model, mock_whisper_model):
+    @patch('whisper.load_model')
+    def test_get_device_cuda(self, mock_load_model, mock_whisper_model, mock_torch):
         """Test device selection with CUDA."""
         mock_torch.cuda.is_available.return_value = True
         mock_torch.backends.mps.is_available.return_value = False
@@ -53,9 +60,8 @@ class TestWhisperTranscriber:
         
         mock_load_model.assert_called_once_with("base", device="cuda")
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_get_device_mps(self, mock_torch, mock_load_model, mock_whisper_model):
+    @patch('whisper.load_model')
+    def test_get_device_mps(self, mock_load_model, mock_whisper_model, mock_torch):
         """Test device selection with MPS."""
         mock_torch.cuda.is_available.return_value = False
         mock_torch.backends.mps.is_available.return_value = True
@@ -66,9 +72,8 @@ class TestWhisperTranscriber:
         
         mock_load_model.assert_called_once_with("base", device="mps")
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_get_device_fallback_to_cpu(self, mock_torch, mock_load_model, mock_whisper_model):
+    @patch('whisper.load_model')
+    def test_get_device_fallback_to_cpu(self, mock_load_model, mock_whisper_model, mock_torch):
         """Test device fallback to CPU when CUDA/MPS unavailable."""
         mock_torch.cuda.is_available.return_value = False
         mock_torch.backends.mps.is_available.return_value = False
@@ -79,9 +84,8 @@ class TestWhisperTranscriber:
         
         mock_load_model.assert_called_once_with("base", device="cpu")
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_transcribe_file_success(self, mock_torch, mock_load_model, config, mock_whisper_model, tmp_path):
+    @patch('whisper.load_model')
+    def test_transcribe_file_success(self, mock_load_model, config, mock_whisper_model, tmp_path, mock_torch):
         """Test successful file transcription."""
         # Setup
         mock_torch.cuda.is_available.return_value = False
@@ -109,7 +113,8 @@ class TestWhisperTranscriber:
         # Verify transcription was called
         mock_whisper_model.transcribe.assert_called_once_with(
             str(audio_file),
-            language='en'
+            language='en',
+            fp16=False
         )
         
         # Verify result structure
@@ -119,9 +124,8 @@ class TestWhisperTranscriber:
         assert result['metadata']['file_path'] == str(audio_file)
         assert result['metadata']['model'] == 'base'
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_transcribe_file_not_found(self, mock_torch, mock_load_model, config, mock_whisper_model):
+    @patch('whisper.load_model')
+    def test_transcribe_file_not_found(self, mock_load_model, config, mock_whisper_model, mock_torch):
         """Test transcription of non-existent file."""
         mock_torch.cuda.is_available.return_value = False
         mock_torch.backends.mps.is_available.return_value = False
@@ -132,9 +136,8 @@ class TestWhisperTranscriber:
         with pytest.raises(FileNotFoundError, match="Audio file not found"):
             transcriber.transcribe_file(Path("nonexistent.mp3"))
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_transcribe_unsupported_format(self, mock_torch, mock_load_model, config, mock_whisper_model, tmp_path):
+    @patch('whisper.load_model')
+    def test_transcribe_unsupported_format(self, mock_load_model, config, mock_whisper_model, tmp_path, mock_torch):
         """Test transcription of unsupported file format."""
         mock_torch.cuda.is_available.return_value = False
         mock_torch.backends.mps.is_available.return_value = False
@@ -149,9 +152,8 @@ class TestWhisperTranscriber:
         with pytest.raises(ValueError, match="Unsupported audio format"):
             transcriber.transcribe_file(unsupported_file)
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_get_transcription_options_default(self, mock_torch, mock_load_model, config, mock_whisper_model):
+    @patch('whisper.load_model')
+    def test_get_transcription_options_default(self, mock_load_model, config, mock_whisper_model, mock_torch):
         """Test default transcription options."""
         mock_torch.cuda.is_available.return_value = False
         mock_torch.backends.mps.is_available.return_value = False
@@ -164,9 +166,8 @@ class TestWhisperTranscriber:
         # Temperature is 0.0 (default), should not be in options
         assert 'temperature' not in options
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_get_transcription_options_custom(self, mock_torch, mock_load_model, mock_whisper_model):
+    @patch('whisper.load_model')
+    def test_get_transcription_options_custom(self, mock_load_model, mock_whisper_model, mock_torch):
         """Test custom transcription options."""
         mock_torch.cuda.is_available.return_value = False
         mock_torch.backends.mps.is_available.return_value = False
@@ -188,9 +189,8 @@ class TestWhisperTranscriber:
         assert options['decode_options']['top_p'] == 0.8
         assert options['decode_options']['top_k'] == 50
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_is_supported_format(self, mock_torch, mock_load_model, config, mock_whisper_model):
+    @patch('whisper.load_model')
+    def test_is_supported_format(self, mock_load_model, config, mock_whisper_model, mock_torch):
         """Test supported format detection."""
         mock_torch.cuda.is_available.return_value = False
         mock_torch.backends.mps.is_available.return_value = False
@@ -202,14 +202,14 @@ class TestWhisperTranscriber:
         assert transcriber._is_supported_format(Path("audio.mp3"))
         assert transcriber._is_supported_format(Path("audio.WAV"))
         assert transcriber._is_supported_format(Path("audio.M4A"))
+        assert transcriber._is_supported_format(Path("audio.opus"))
         
         # Test unsupported formats
         assert not transcriber._is_supported_format(Path("document.pdf"))
         assert not transcriber._is_supported_format(Path("image.jpg"))
     
-    @patch('src.transcriber.whisper.load_model')
-    @patch('src.transcriber.torch')
-    def test_get_model_info(self, mock_torch, mock_load_model, config, mock_whisper_model):
+    @patch('whisper.load_model')
+    def test_get_model_info(self, mock_load_model, config, mock_whisper_model, mock_torch):
         """Test model information retrieval."""
         mock_torch.cuda.is_available.return_value = False
         mock_torch.backends.mps.is_available.return_value = False
@@ -228,11 +228,493 @@ class TestWhisperTranscriber:
         assert info['device'] == 'cpu'
         assert info['parameters'] == 1000000
         assert info['is_multilingual'] is True
+        
+        # The parameter count is computed once and reused
+        transcriber.get_model_info()
+        mock_param.numel.assert_called_once()
+    
+    @patch('whisper.load_model')
+    def test_compute_type_float16_requires_accelerator(self, mock_load_model, mock_torch):
+        """Test float16 is rejected on CPU before the model is loaded."""
+        config = TranscriptionConfig(audio_file=Path("test.mp3"), device="cpu", compute_type="float16")
+        
+        with pytest.raises(ValueError, match="requires a cuda or mps device"):
+            WhisperTranscriber(config)
+        
+        mock_load_model.assert_not_called()
+    
+    @patch.object(WhisperTranscriber, '_quantize_int8')
+    @patch('whisper.load_model')
+    def test_compute_type_int8_quantizes_model(self, mock_load_model, mock_quantize,
+                                              mock_whisper_model, mock_torch):
+        """Test int8 compute type dynamically quantizes the loaded model."""
+        mock_load_model.return_value = mock_whisper_model
+        config = TranscriptionConfig(audio_file=Path("test.mp3"), device="cpu", compute_type="int8")
+        
+        transcriber = WhisperTranscriber(config)
+        
+        mock_quantize.assert_called_once_with(mock_whisper_model)
+        assert transcriber.model == mock_quantize.return_value
+        assert transcriber._get_transcription_options()['fp16'] is False
+    
+    @patch('whisper.load_model')
+    def test_default_compute_type_enables_fp16_on_gpu(self, mock_load_model, mock_whisper_model, mock_torch):
+        """Test GPU decoding runs in FP16 unless a compute type says otherwise."""
+        mock_torch.cuda.is_available.return_value = True
+        mock_load_model.return_value = mock_whisper_model
+        config = TranscriptionConfig(audio_file=Path("test.mp3"), device="cuda")
+        
+        transcriber = WhisperTranscriber(config)
+        
+        assert transcriber._get_transcription_options()['fp16'] is True
+    
+    @patch('whisper.load_model')
+    def test_compute_type_float32_disables_fp16_on_gpu(self, mock_load_model, mock_whisper_model, mock_torch):
+        """Test float32 compute type keeps GPU decoding in full precision."""
+        mock_torch.cuda.is_available.return_value = True
+        mock_load_model.return_value = mock_whisper_model
+        config = TranscriptionConfig(audio_file=Path("test.mp3"), device="cuda", compute_type="float32")
+        
+        transcriber = WhisperTranscriber(config)
+        
+        assert transcriber.model is mock_whisper_model
+        assert transcriber._get_transcription_options()['fp16'] is False
+    
+    @patch('whisper.load_model')
+    def test_faster_backend_transcribe_file(self, mock_load_model, tmp_path, mock_torch):
+        """Test the faster backend loads a CTranslate2 model and keeps the result shape."""
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio data")
+        
+        segment = Mock(id=1, seek=0, start=0.0, end=2.5, text=" Hello world.", tokens=[1, 2],
+                       temperature=0.0, avg_logprob=-0.2, compression_ratio=1.1, no_speech_prob=0.01)
+        faster_model = Mock()
+        faster_model.transcribe.return_value = (iter([segment]), Mock(language="en"))
+        faster_whisper = Mock()
+        faster_whisper.WhisperModel.return_value = faster_model
+        
+        config = TranscriptionConfig(audio_file=audio_file, backend="faster", device="cpu")
+        with patch.dict('sys.modules', {'faster_whisper': faster_whisper}):
+            transcriber = WhisperTranscriber(config)
+        result = transcriber.transcribe_file(audio_file)
+        
+        mock_load_model.assert_not_called()
+        faster_whisper.WhisperModel.assert_called_once_with(
+            "base", device="cpu", compute_type="int8", cpu_threads=_physical_cores()
+        )
+        faster_model.transcribe.assert_called_once_with(str(audio_file), language="en", beam_size=1)
+        assert result['text'] == " Hello world."
+        assert result['segments'][0]['end'] == 2.5
+        assert result['metadata']['duration'] == 2.5
+    
+    def test_faster_backend_missing_package(self, mock_torch):
+        """Test a helpful error when faster-whisper is not installed."""
+        config = TranscriptionConfig(audio_file=Path("test.mp3"), backend="faster", device="cpu")
+        
+        with patch.dict('sys.modules', {'faster_whisper': None}):
+            with pytest.raises(ImportError, match="requires faster-whisper"):
+                WhisperTranscriber(config)
+    
+    @patch('whisper.load_model')
+    def test_get_model_info_without_parameters(self, mock_load_model, config, mock_whisper_model, mock_torch):
+        """Test model info falls back to the resolved device when no parameters are exposed."""
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_whisper_model.parameters.return_value = []
+        mock_load_model.return_value = mock_whisper_model
+        
+        info = WhisperTranscriber(config).get_model_info()
+        
+        assert info['device'] == 'cpu'
+        assert info['parameters'] == 0
+    
+    def test_quantize_int8_swaps_whisper_linear(self):
+        """Test int8 quantization converts whisper's Linear subclass."""
+        import torch
+        import whisper
+        
+        model = torch.nn.Sequential(whisper.model.Linear(4, 4))
+        quantized = WhisperTranscriber._quantize_int8(model)
+        
+        assert quantized is model
+        assert isinstance(quantized[0], torch.ao.nn.quantized.dynamic.Linear)
+        assert quantized(torch.ones(1, 4)).shape == (1, 4)
+    
+    @patch('whisper.load_model')
+    def test_transcribe_file_autocasts_on_gpu(self, mock_load_model, mock_whisper_model, tmp_path, mock_torch):
+        """Test GPU transcription runs under FP16 autocast."""
+        mock_torch.cuda.is_available.return_value = True
+        mock_load_model.return_value = mock_whisper_model
+        mock_whisper_model.transcribe.return_value = {'text': 'Hi', 'segments': [], 'language': 'en'}
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio data")
+        
+        config = TranscriptionConfig(audio_file=audio_file, device="cuda")
+        transcriber = WhisperTranscriber(config)
+        # Ignore the load-time warm-up
+        mock_torch.autocast.reset_mock()
+        mock_torch.inference_mode.reset_mock()
+        transcriber.transcribe_file(audio_file)
+        
+        mock_torch.autocast.assert_called_once_with(device_type="cuda", dtype=mock_torch.float16)
+        mock_torch.autocast.return_value.__enter__.assert_called_once()
+        mock_torch.inference_mode.return_value.__enter__.assert_called_once()
+        mock_torch.set_float32_matmul_precision.assert_called_once_with("high")
+    
+    @patch('whisper.load_model')
+    def test_model_cache_reuses_loaded_model(self, mock_load_model, config, mock_whisper_model, mock_torch):
+        """Test transcribers with the same model settings share one loaded model."""
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_load_model.return_value = mock_whisper_model
+        
+        first = WhisperTranscriber(config)
+        second = WhisperTranscriber(config)
+        assert first.model is second.model
+        mock_load_model.assert_called_once()
+        
+        WhisperTranscriber(TranscriptionConfig(audio_file=Path("test.mp3"), model="tiny"))
+        assert mock_load_model.call_count == 2
+        
+        WhisperTranscriber.clear_cache()
+        WhisperTranscriber(config)
+        assert mock_load_model.call_count == 3
+    
+    @patch('src.transcriber._MODEL_CACHE_SIZE', 2)
+    @patch('whisper.load_model')
+    def test_model_cache_evicts_least_recently_used(self, mock_load_model, config, mock_torch):
+        """Test the model cache is bounded and evicts the least recently used model."""
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_load_model.side_effect = lambda *args, **kwargs: Mock()
+        
+        def load(model):
+            return WhisperTranscriber(TranscriptionConfig(audio_file=Path("test.mp3"), model=model))
+        
+        load("tiny")
+        load("base")
+        load("tiny")
+        load("small")
+        assert mock_load_model.call_count == 3
+        
+        load("tiny")
+        assert mock_load_model.call_count == 3
+        
+        load("base")
+        assert mock_load_model.call_count == 4
+    
+    @patch('whisper.load_model')
+    def test_device_resolved_once(self, mock_load_model, mock_whisper_model, tmp_path, mock_torch):
+        """Test device availability is probed once, not per file or per transcriber."""
+        mock_torch.cuda.is_available.return_value = True
+        mock_load_model.return_value = mock_whisper_model
+        mock_whisper_model.transcribe.return_value = {'text': 'Hi', 'segments': [], 'language': 'en'}
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio data")
+        
+        transcriber = WhisperTranscriber(TranscriptionConfig(audio_file=audio_file, device="cuda"))
+        probes = mock_torch.cuda.is_available.call_count
+        transcriber.transcribe_file(audio_file)
+        transcriber.transcribe_file(audio_file)
+        WhisperTranscriber(TranscriptionConfig(audio_file=audio_file, device="cuda", model="tiny"))
+        
+        assert transcriber._device == "cuda"
+        assert mock_torch.cuda.is_available.call_count == probes
+    
+    @patch('whisper.load_model')
+    def test_compile_model_compiles_and_warms_up(self, mock_load_model, mock_whisper_model, mock_torch):
+        """Test compile_model wraps encoder and decoder and runs a warm-up pass."""
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_load_model.return_value = mock_whisper_model
+        mock_whisper_model.dims.n_mels = 80
+        compiled_encoder, compiled_decoder = Mock(), Mock()
+        mock_torch.compile.side_effect = [compiled_encoder, compiled_decoder]
+        
+        config = TranscriptionConfig(audio_file=Path("test.mp3"), compile_model=True)
+        transcriber = WhisperTranscriber(config)
+        
+        assert transcriber.model.encoder is compiled_encoder
+        assert transcriber.model.decoder is compiled_decoder
+        mock_torch.zeros.assert_called_once_with(1, 80, 3000, device="cpu", dtype=mock_torch.float32)
+        compiled_encoder.assert_called_once_with(mock_torch.zeros.return_value)
+    
+    @patch.dict('os.environ', clear=True)
+    @patch('src.transcriber._physical_cores', return_value=6)
+    @patch('whisper.load_model')
+    def test_cpu_threads_match_physical_cores(self, mock_load_model, mock_cores, config,
+                                             mock_whisper_model, mock_torch):
+        """Test CPU inference uses one thread per physical core and no inter-op pool."""
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_load_model.return_value = mock_whisper_model
+        
+        WhisperTranscriber(config)
+        
+        mock_torch.set_num_threads.assert_called_once_with(6)
+        mock_torch.set_num_interop_threads.assert_called_once_with(1)
+    
+    @patch('whisper.load_model')
+    def test_gpu_model_is_warmed_up(self, mock_load_model, mock_whisper_model, mock_torch):
+        """Test GPU models run a warm-up encoder pass at load time."""
+        mock_torch.cuda.is_available.return_value = True
+        mock_load_model.return_value = mock_whisper_model
+        mock_whisper_model.dims.n_mels = 128
+        
+        WhisperTranscriber(TranscriptionConfig(audio_file=Path("test.mp3"), device="cuda"))
+        
+        assert mock_torch.backends.cudnn.benchmark is True
+        mock_torch.zeros.assert_called_once_with(1, 128, 3000, device="cuda", dtype=mock_torch.float16)
+        mock_whisper_model.encoder.assert_called_once_with(mock_torch.zeros.return_value)
+    
+    @patch('whisper.load_model')
+    def test_stack_on_device_copies_on_side_stream(self, mock_load_model, mock_whisper_model, mock_torch):
+        """Test CUDA mel batches are copied on a reused side stream the compute stream waits on."""
+        mock_torch.cuda.is_available.return_value = True
+        mock_load_model.return_value = mock_whisper_model
+        transcriber = WhisperTranscriber(TranscriptionConfig(audio_file=Path("test.mp3"), device="cuda"))
+        
+        mels = [Mock(), Mock()]
+        transcriber._stack_on_device(mels)
+        mel = transcriber._stack_on_device(mels)
+        
+        mock_torch.cuda.Stream.assert_called_once()
+        copy_stream = mock_torch.cuda.Stream.return_value
+        mock_torch.cuda.stream.assert_called_with(copy_stream)
+        mels[0].to.assert_called_with(mock_whisper_model.device, non_blocking=True)
+        compute_stream = mock_torch.cuda.current_stream.return_value
+        compute_stream.wait_stream.assert_called_with(copy_stream)
+        mel.record_stream.assert_called_with(compute_stream)
+    
+    def test_import_does_not_load_torch(self):
+        """Test importing the app pulls in torch/whisper only when a transcriber is built."""
+        import subprocess
+        import sys
+        
+        code = "import sys, src.app; print('torch' in sys.modules, 'whisper' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                check=True, cwd=Path(__file__).parent.parent)
+        
+        assert output.stdout.split() == ["False", "False"]
+    
+    @patch('whisper.load_model')
+    def test_transcription_options_built_once(self, mock_load_model, config, mock_whisper_model,
+                                              tmp_path, mock_torch):
+        """Test per-file transcription reuses the options built at construction."""
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_load_model.return_value = mock_whisper_model
+        mock_whisper_model.transcribe.return_value = {'text': 'Hi', 'segments': [], 'language': 'en'}
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio data")
+        
+        transcriber = WhisperTranscriber(config)
+        with patch.object(transcriber, '_get_transcription_options') as mock_options:
+            transcriber.transcribe_file(audio_file)
+            transcriber.transcribe_file(audio_file)
+        
+        mock_options.assert_not_called()
+        mock_whisper_model.transcribe.assert_called_with(str(audio_file), language='en', fp16=False)
     
-    @patch('src.transcriber.whisper.load_model')
+    @patch('whisper.load_model')
     def test_model_loading_failure(self, mock_load_model, config):
         """Test model loading failure."""
         mock_load_model.side_effect = Exception("Model loading failed")
         
         with pytest.raises(Exception, match="Model loading failed"):
-            WhisperTranscriber(config)
\ No newline at end of file
+            WhisperTranscriber(config)
+    
+    @patch('whisper.decode')
+    @patch('whisper.pad_or_trim')
+    @patch('whisper.log_mel_spectrogram')
+    @patch('whisper.load_audio')
+    @patch('whisper.load_model')
+    def test_transcribe_files_batches_short_clips(self, mock_load_model, mock_load_audio,
+                                                  mock_log_mel, mock_pad_or_trim, mock_decode,
+                                                  config, mock_whisper_model, tmp_path, mock_torch):
+        """Test that short clips share one decode pass and long files fall back."""
+        import numpy as np
+        import whisper
+        
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_load_model.return_value = mock_whisper_model
+        
+        paths = []
+        for name in ["short1.mp3", "long.mp3", "short2.wav"]:
+            path = tmp_path / name
+            path.touch()
+            paths.append(path)
+        
+        sample_rate = whisper.audio.SAMPLE_RATE
+        audio = {
+            "short1.mp3": np.zeros(sample_rate, dtype=np.float32),
+            "long.mp3": np.zeros(whisper.audio.N_SAMPLES + 1, dtype=np.float32),
+            "short2.wav": np.zeros(2 * sample_rate, dtype=np.float32)
+        }
+        # Files are decoded on a thread pool, so key the fake audio by name
+        mock_load_audio.side_effect = lambda path: audio[Path(path).name]
+        tokenizer = whisper.tokenizer.get_tokenizer(True, num_languages=99)
+        ts = tokenizer.timestamp_begin
+        mock_decode.return_value = [
+            # Two timestamped segments, the last closed by a single timestamp
+            Mock(tokens=[ts, *tokenizer.encode(" First"), ts + 20, ts + 20, *tokenizer.encode(" part"), ts + 45],
+                 language='en', temperature=0.0, avg_logprob=-0.1, compression_ratio=1.0, no_speech_prob=0.0),
+            Mock(tokens=[ts, *tokenizer.encode(" Second"), ts + 90],
+                 language='en', temperature=0.0, avg_logprob=-0.1, compression_ratio=1.0, no_speech_prob=0.0)
+        ]
+        mock_whisper_model.transcribe.return_value = {
+            'text': 'Long', 'language': 'en',
+            'segments': [{'start': 0.0, 'end': 31.0, 'text': 'Long'}]
+        }
+        
+        transcriber = WhisperTranscriber(config)
+        results = transcriber.transcribe_files(paths)
+        
+        mock_decode.assert_called_once()
+        mock_whisper_model.transcribe.assert_called_once()
+        assert [r['text'] for r in results] == [' First part', 'Long', ' Second']
+        assert [r['metadata']['file_path'] for r in results] == [str(p) for p in paths]
+        assert [(s['start'], s['end'], s['text']) for s in results[0]['segments']] == [
+            (0.0, 0.4, ' First'), (0.4, 0.9, ' part')
+        ]
+        assert results[2]['metadata']['duration'] == 1.8
+    
+    @patch('whisper.decode')
+    @patch('whisper.pad_or_trim')
+    @patch('whisper.log_mel_spectrogram')
+    @patch('whisper.load_audio')
+    @patch('whisper.load_model')
+    def test_transcribe_files_filters_like_transcribe(self, mock_load_model, mock_load_audio,
+                                                      mock_log_mel, mock_pad_or_trim, mock_decode,
+                                                      config, mock_whisper_model, tmp_path, mock_torch):
+        """Test batched clips get transcribe()'s silence skipping and fallbacks."""
+        import numpy as np
+        import whisper
+        
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_load_model.return_value = mock_whisper_model
+        mock_load_audio.return_value = np.zeros(2 * whisper.audio.SAMPLE_RATE, dtype=np.float32)
+        
+        paths = []
+        for name in ["silent.mp3", "repetitive.mp3", "unfinished.mp3"]:
+            path = tmp_path / name
+            path.touch()
+            paths.append(path)
+        
+        tokenizer = whisper.tokenizer.get_tokenizer(True, num_languages=99)
+        ts = tokenizer.timestamp_begin
+        text = tokenizer.encode(" Hello")
+        mock_decode.return_value = [
+            Mock(tokens=[ts, *text, ts + 50], language='en', temperature=0.0,
+                 avg_logprob=-1.5, compression_ratio=1.0, no_speech_prob=0.9),
+            Mock(tokens=[ts, *text, ts + 50], language='en', temperature=0.0,
+                 avg_logprob=-0.1, compression_ratio=3.0, no_speech_prob=0.0),
+            # The last segment has no closing timestamp before the clip ends
+            Mock(tokens=[ts, *text, ts + 25, ts + 25, *text], language='en', temperature=0.0,
+                 avg_logprob=-0.1, compression_ratio=1.0, no_speech_prob=0.0)
+        ]
+        mock_whisper_model.transcribe.return_value = {'text': 'Retried', 'language': 'en', 'segments': []}
+        
+        transcriber = WhisperTranscriber(config)
+        results = transcriber.transcribe_files(paths)
+        
+        assert results[0]['text'] == ''
+        assert results[0]['segments'] == []
+        assert [r['text'] for r in results[1:]] == ['Retried', 'Retried']
+        assert mock_whisper_model.transcribe.call_count == 2
+    
+    @patch('whisper.load_audio')
+    def test_preloaded_mel_matches_transcribe_input(self, mock_load_audio, config, tmp_path):
+        """Test a batched clip's mel, padding included, is the window transcribe() decodes."""
+        import numpy as np
+        import torch
+        import whisper
+        
+        rng = np.random.default_rng(0)
+        audio = {
+            # Lengths on and off a hop boundary exercise the last STFT frames
+            "a.wav": (rng.standard_normal(16000) * 0.1).astype(np.float32),
+            "b.wav": (rng.standard_normal(16123) * 0.1).astype(np.float32)
+        }
+        mock_load_audio.side_effect = lambda path: audio[Path(path).name]
+        paths = []
+        for name in audio:
+            path = tmp_path / name
+            path.touch()
+            paths.append(path)
+        
+        transcriber = WhisperTranscriber(config)
+        transcriber.model.dims.n_mels = 80
+        preloaded = transcriber.preload_mels(paths)
+        
+        for path, (_, mel) in zip(paths, preloaded):
+            decoded = []
+            model = Mock(is_multilingual=False, num_languages=99, device=torch.device("cpu"))
+            model.dims.n_mels = 80
+            model.dims.n_audio_ctx = 1500
+            model.dims.n_text_ctx = 448
+            model.decode.side_effect = lambda segment, options, decoded=decoded: decoded.append(segment) or Mock(
+                tokens=[], temperature=0.0, avg_logprob=0.0, compression_ratio=1.0, no_speech_prob=0.0
+            )
+            whisper.transcribe(model, audio[path.name], language="en", fp16=False)
+            
+            assert mel.shape == decoded[0].shape
+            assert torch.equal(mel, decoded[0])
+    
+    @patch('whisper.decode')
+    @patch('whisper.load_model')
+    def test_transcribe_files_isolates_failed_file(self, mock_load_model, mock_decode,
+                                                   config, mock_whisper_model, tmp_path, mock_torch):
+        """Test one file failing on its own leaves None in its slot and keeps the batch."""
+        import numpy as np
+        import whisper
+        
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_load_model.return_value = mock_whisper_model
+        mock_whisper_model.transcribe.side_effect = RuntimeError("corrupt audio")
+        
+        paths = []
+        for name in ["long.mp3", "short1.mp3", "short2.mp3"]:
+            path = tmp_path / name
+            path.touch()
+            paths.append(path)
+        
+        short = np.zeros(whisper.audio.SAMPLE_RATE, dtype=np.float32)
+        preloaded = [(Mock(), None), (short, Mock()), (short, Mock())]
+        tokenizer = whisper.tokenizer.get_tokenizer(True, num_languages=99)
+        ts = tokenizer.timestamp_begin
+        mock_decode.return_value = [
+            Mock(tokens=[ts, *tokenizer.encode(text), ts + 40], language='en', temperature=0.0,
+                 avg_logprob=-0.1, compression_ratio=1.0, no_speech_prob=0.0)
+            for text in (" One", " Two")
+        ]
+        
+        results = WhisperTranscriber(config).transcribe_files(paths, preloaded)
+        
+        mock_decode.assert_called_once()
+        assert results[0] is None
+        assert [r['text'] for r in results[1:]] == [' One', ' Two']
+    
+    @patch('whisper.load_audio')
+    @patch('whisper.load_model')
+    def test_transcribe_files_uses_preloaded_audio(self, mock_load_model, mock_load_audio,
+                                                   config, mock_whisper_model, tmp_path, mock_torch):
+        """Test preloaded audio is transcribed without decoding the file again."""
+        mock_torch.cuda.is_available.return_value = False
+        mock_torch.backends.mps.is_available.return_value = False
+        mock_load_model.return_value = mock_whisper_model
+        mock_whisper_model.transcribe.return_value = {'text': 'Hello', 'language': 'en', 'segments': []}
+        
+        audio_file = tmp_path / "test.mp3"
+        audio_file.touch()
+        audio = Mock()
+        
+        transcriber = WhisperTranscriber(config)
+        results = transcriber.transcribe_files([audio_file], [(audio, None)])
+        
+        mock_load_audio.assert_not_called()
+        mock_whisper_model.transcribe.assert_called_once_with(audio, language='en', fp16=False)
+        assert results[0]['text'] == 'Hello'